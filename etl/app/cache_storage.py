@@ -8,22 +8,45 @@ import logging
 import time
 import psutil
 from typing import Dict, Optional, Any
-from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import pandas as pd
+import polars as pl
+import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _batch_size_bytes(batch: pa.RecordBatch) -> int:
+    """
+    Size of an Arrow RecordBatch in bytes - O(nbuffers), no per-cell scan
+    """
+    return batch.get_total_buffer_size()
+
+
+@dataclass(slots=True)
 class CacheItem:
-    """Cache item with metadata"""
+    """Cache item with metadata (doubly-linked for O(1) LRU tracking)
+
+    slots=True drops the per-instance __dict__ (~100B each across a
+    300-item cache) and makes attribute access a slot-offset load, which
+    the LRU traversals hit in a tight loop.
+    """
     chunk_id: int
     table_name: str
-    data: pd.DataFrame
+    data: pa.RecordBatch
     timestamp: float
-    size_mb: float
+    size_bytes: int
     producer_id: int
+    prev: Optional["CacheItem"] = field(default=None, repr=False)
+    next: Optional["CacheItem"] = field(default=None, repr=False)
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Convert the cached RecordBatch back to a pandas DataFrame"""
+        return self.data.to_pandas()
+
+    def to_polars(self) -> pl.DataFrame:
+        """Rebuild a Polars frame over the cached Arrow buffers (zero-copy)"""
+        return pl.from_arrow(self.data)
 
 
 class CacheStorage:
@@ -46,31 +69,67 @@ class CacheStorage:
             max_items: Maximum number of items in cache
         """
         self.max_size_mb = max_size_mb
+        self.max_size_bytes = max_size_mb * 1024 * 1024
         self.max_items = max_items
         
         # Storage
         self.cache: Dict[str, CacheItem] = {}  # key: f"{table}_{chunk_id}"
-        self.queue = asyncio.Queue()
-        self.access_order = deque()  # LRU tracking
+        # One handoff queue per table: with several tables in flight a
+        # consumer must only ever be handed its own table's chunks
+        self._queues: Dict[str, asyncio.Queue] = {}
+
+        # LRU tracking: intrusive doubly-linked list with head/tail sentinels
+        # (O(1) insert/touch/evict/remove - no deque scans)
+        self._lru_head = CacheItem(-1, "", None, 0.0, 0, -1)
+        self._lru_tail = CacheItem(-1, "", None, 0.0, 0, -1)
+        self._lru_head.next = self._lru_tail
+        self._lru_tail.prev = self._lru_head
         
-        # Statistics
+        # Hot counters as plain attributes - is_empty/is_full and the
+        # eviction predicate sit on the producer fast path, and attribute
+        # access beats string-keyed dict lookups
+        self._n_items = 0
+        # Size tracked in integer bytes: no float drift from repeated
+        # add/subtract, and it matches the Arrow buffer sizes directly
+        self._size_bytes = 0
+        self._peak_size_bytes = 0
+
+        # High-water alarm: put() sets the event when usage crosses 80%,
+        # get()/eviction re-arm it once usage falls back below 70%. The
+        # monitor awaits this instead of polling on a timer.
+        self.high_water_event = asyncio.Event()
+        self._above_high_water = False
+
+        # Resolve the psutil handle once - Process() re-reads the PID and
+        # proc metadata on every construction
+        self._process = psutil.Process()
+
+        # Statistics (current_* are exposed through get_stats)
         self.stats = {
             'total_items_stored': 0,
             'total_items_retrieved': 0,
             'total_items_evicted': 0,
-            'current_size_mb': 0,
-            'current_items': 0,
             'cache_hits': 0,
             'cache_misses': 0,
-            'peak_size_mb': 0,
             'peak_items': 0
         }
         
-        # Locks
-        self.lock = asyncio.Lock()
-        
         logger.info(f"📦 Cache Storage initialized: max_size={max_size_mb}MB, max_items={max_items}")
-    
+
+    def _lru_append(self, item: CacheItem):
+        """Link item before the tail sentinel (most recently used) - O(1)"""
+        item.prev = self._lru_tail.prev
+        item.next = self._lru_tail
+        self._lru_tail.prev.next = item
+        self._lru_tail.prev = item
+
+    def _lru_unlink(self, item: CacheItem):
+        """Unlink item from the LRU list - O(1)"""
+        item.prev.next = item.next
+        item.next.prev = item.prev
+        item.prev = None
+        item.next = None
+
     async def put(self, table_name: str, chunk_id: int, data: pd.DataFrame, producer_id: int) -> bool:
         """
         Store data chunk in cache
@@ -84,92 +143,117 @@ class CacheStorage:
         Returns:
             True if stored successfully
         """
-        async with self.lock:
-            try:
-                # Calculate size
-                size_mb = data.memory_usage(deep=True).sum() / 1024 / 1024
-                
-                # Check if we need to evict
-                while (self.stats['current_size_mb'] + size_mb > self.max_size_mb or 
-                       self.stats['current_items'] >= self.max_items):
-                    if not await self._evict_lru():
-                        logger.warning("⚠️  Cache full, cannot evict more items")
-                        return False
-                
-                # Create cache item
-                cache_key = f"{table_name}_{chunk_id}"
-                item = CacheItem(
-                    chunk_id=chunk_id,
-                    table_name=table_name,
-                    data=data,
-                    timestamp=time.time(),
-                    size_mb=size_mb,
-                    producer_id=producer_id
-                )
-                
-                # Store in cache
-                self.cache[cache_key] = item
-                self.access_order.append(cache_key)
-                
-                # Update stats
-                self.stats['total_items_stored'] += 1
-                self.stats['current_items'] += 1
-                self.stats['current_size_mb'] += size_mb
-                
-                # Track peaks
-                if self.stats['current_size_mb'] > self.stats['peak_size_mb']:
-                    self.stats['peak_size_mb'] = self.stats['current_size_mb']
-                if self.stats['current_items'] > self.stats['peak_items']:
-                    self.stats['peak_items'] = self.stats['current_items']
-                
-                # Put in queue for consumers
-                await self.queue.put(cache_key)
-                
-                logger.debug(f"📦 Cached: {cache_key} ({size_mb:.2f}MB) - Cache: {self.stats['current_items']} items, {self.stats['current_size_mb']:.1f}MB")
-                
-                return True
-                
-            except Exception as e:
-                logger.error(f"❌ Cache put error: {e}")
-                return False
+        # No lock needed: the event loop is single-threaded and all mutations
+        # below happen synchronously before the one await at the end
+        try:
+            # Convert to Arrow columnar layout - avoids pandas BlockManager
+            # copies on handoff and makes sizing O(nbuffers). Polars frames
+            # are already Arrow-backed, so that path is zero-copy.
+            if isinstance(data, pl.DataFrame):
+                tbl = data.to_arrow().combine_chunks()
+                if tbl.num_rows:
+                    batch = tbl.to_batches()[0]
+                else:
+                    batch = pa.RecordBatch.from_pandas(data.to_pandas(), preserve_index=False)
+            else:
+                batch = pa.RecordBatch.from_pandas(data, preserve_index=False)
+            size_bytes = _batch_size_bytes(batch)
+
+            # Check if we need to evict (one bulk pass, not item-at-a-time)
+            if (self._size_bytes + size_bytes > self.max_size_bytes or
+                    self._n_items >= self.max_items):
+                if not self._evict_bulk(size_bytes):
+                    logger.warning("⚠️  Cache full, cannot evict more items")
+                    return False
+
+            # Create cache item
+            cache_key = f"{table_name}_{chunk_id}"
+            item = CacheItem(
+                chunk_id=chunk_id,
+                table_name=table_name,
+                data=batch,
+                timestamp=time.time(),
+                size_bytes=size_bytes,
+                producer_id=producer_id
+            )
+
+            # Store in cache
+            self.cache[cache_key] = item
+            self._lru_append(item)
+
+            # Update stats
+            self.stats['total_items_stored'] += 1
+            self._n_items += 1
+            self._size_bytes += size_bytes
+
+            # Track peaks
+            if self._size_bytes > self._peak_size_bytes:
+                self._peak_size_bytes = self._size_bytes
+            if self._n_items > self.stats['peak_items']:
+                self.stats['peak_items'] = self._n_items
+
+            # Fire the high-water alarm once per excursion above 80%
+            if (not self._above_high_water and
+                    self._size_bytes * 10 > self.max_size_bytes * 8):
+                self._above_high_water = True
+                self.high_water_event.set()
+
+            # Put in queue for consumers (unbounded Queue - never suspends)
+            await self._queues.setdefault(table_name, asyncio.Queue()).put(cache_key)
+
+            logger.debug(f"📦 Cached: {cache_key} ({size_bytes / 1048576:.2f}MB) - Cache: {self._n_items} items, {self._size_bytes / 1048576:.1f}MB")
+
+            return True
+
+        except pa.ArrowException as e:
+            # Only conversion failures degrade to the direct queue - a
+            # programming error must surface, not masquerade as cache-full
+            logger.error(f"❌ Cache put error: {e}")
+            return False
     
-    async def get(self, timeout: float = 5.0) -> Optional[CacheItem]:
+    async def get(self, table_name: str, timeout: float = 5.0) -> Optional[CacheItem]:
         """
         Retrieve data chunk from cache
         
         Args:
-            timeout: Timeout in seconds
+            table_name: Table whose chunks to retrieve
+            timeout: Timeout in seconds (None blocks until data arrives)
             
         Returns:
             CacheItem or None if timeout
         """
         try:
-            # Get from queue (blocks until available)
-            cache_key = await asyncio.wait_for(self.queue.get(), timeout=timeout)
-            
-            async with self.lock:
-                # Get from cache
-                if cache_key in self.cache:
-                    item = self.cache[cache_key]
-                    
-                    # Remove from cache
-                    del self.cache[cache_key]
-                    if cache_key in self.access_order:
-                        self.access_order.remove(cache_key)
-                    
-                    # Update stats
-                    self.stats['total_items_retrieved'] += 1
-                    self.stats['current_items'] -= 1
-                    self.stats['current_size_mb'] -= item.size_mb
-                    self.stats['cache_hits'] += 1
-                    
-                    logger.debug(f"📤 Retrieved: {cache_key} ({item.size_mb:.2f}MB) - Cache: {self.stats['current_items']} items")
-                    
-                    return item
-                else:
-                    self.stats['cache_misses'] += 1
-                    logger.warning(f"⚠️  Cache miss: {cache_key}")
-                    return None
+            # Get from this table's queue (blocks until available); all cache
+            # mutations after this point are synchronous, so no lock is needed
+            queue = self._queues.setdefault(table_name, asyncio.Queue())
+            cache_key = await asyncio.wait_for(queue.get(), timeout=timeout)
+
+            if cache_key in self.cache:
+                item = self.cache[cache_key]
+
+                # Remove from cache
+                del self.cache[cache_key]
+                self._lru_unlink(item)
+
+                # Update stats
+                self.stats['total_items_retrieved'] += 1
+                self._n_items -= 1
+                self._size_bytes -= item.size_bytes
+                self.stats['cache_hits'] += 1
+
+                # Re-arm the high-water alarm below 70% (hysteresis so the
+                # alarm does not flap around the threshold)
+                if (self._above_high_water and
+                        self._size_bytes * 10 < self.max_size_bytes * 7):
+                    self._above_high_water = False
+
+                logger.debug(f"📤 Retrieved: {cache_key} ({item.size_bytes / 1048576:.2f}MB) - Cache: {self._n_items} items")
+
+                return item
+            else:
+                self.stats['cache_misses'] += 1
+                logger.warning(f"⚠️  Cache miss: {cache_key}")
+                return None
                     
         except asyncio.TimeoutError:
             return None
@@ -177,51 +261,72 @@ class CacheStorage:
             logger.error(f"❌ Cache get error: {e}")
             return None
     
-    async def _evict_lru(self) -> bool:
+    def _evict_bulk(self, incoming_bytes: int) -> bool:
         """
-        Evict least recently used item
-        
+        Evict least recently used items in a single head-to-tail pass
+
+        Evicts down to a 90% size watermark so a burst of puts does not
+        re-trigger eviction immediately - O(k) in the number evicted.
+
+        Args:
+            incoming_bytes: Size of the chunk about to be stored
+
         Returns:
-            True if evicted successfully
+            True if the incoming chunk now fits
         """
-        if not self.access_order:
-            return False
-        
-        # Get LRU item
-        cache_key = self.access_order.popleft()
-        
-        if cache_key in self.cache:
-            item = self.cache[cache_key]
-            
-            # Remove from cache
+        target_bytes = self.max_size_bytes * 9 // 10 - incoming_bytes
+        target_items = self.max_items - 1
+        evicted = 0
+
+        item = self._lru_head.next
+        while item is not self._lru_tail and (self._size_bytes > target_bytes or
+                                              self._n_items > target_items):
+            next_item = item.next
+            cache_key = f"{item.table_name}_{item.chunk_id}"
+
+            self._lru_unlink(item)
             del self.cache[cache_key]
-            
-            # Update stats
+
             self.stats['total_items_evicted'] += 1
-            self.stats['current_items'] -= 1
-            self.stats['current_size_mb'] -= item.size_mb
-            
-            logger.debug(f"🗑️  Evicted LRU: {cache_key} ({item.size_mb:.2f}MB)")
-            
-            return True
-        
-        return False
+            self._n_items -= 1
+            self._size_bytes -= item.size_bytes
+            evicted += 1
+
+            item = next_item
+
+        if evicted:
+            logger.debug(f"🗑️  Evicted {evicted} LRU items - Cache: {self._n_items} items, {self._size_bytes / 1048576:.1f}MB")
+
+        if (self._above_high_water and
+                self._size_bytes * 10 < self.max_size_bytes * 7):
+            self._above_high_water = False
+
+        return (self._size_bytes + incoming_bytes <= self.max_size_bytes and
+                self._n_items < self.max_items)
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics"""
-        process = psutil.Process()
-        memory_mb = process.memory_info().rss / 1024 / 1024
-        
-        return {
-            **self.stats,
-            'process_memory_mb': memory_mb,
+    def get_stats(self, include_process_memory: bool = True) -> Dict[str, Any]:
+        """Get cache statistics
+
+        Args:
+            include_process_memory: Set False on hot paths to skip the
+                ~100us psutil RSS syscall
+        """
+        hits_misses = self.stats['cache_hits'] + self.stats['cache_misses']
+        return self.stats | {
+            'current_items': self._n_items,
+            'current_size_mb': self._size_bytes / 1048576,
+            'peak_size_mb': self._peak_size_bytes / 1048576,
+            'process_memory_mb': (
+                self._process.memory_info().rss / 1048576
+                if include_process_memory else 0.0
+            ),
             'cache_hit_rate': (
-                self.stats['cache_hits'] / (self.stats['cache_hits'] + self.stats['cache_misses']) * 100
-                if (self.stats['cache_hits'] + self.stats['cache_misses']) > 0 else 0
+                self.stats['cache_hits'] / hits_misses * 100
+                if hits_misses > 0 else 0
             ),
             'avg_item_size_mb': (
-                self.stats['current_size_mb'] / self.stats['current_items']
-                if self.stats['current_items'] > 0 else 0
+                self._size_bytes / 1048576 / self._n_items
+                if self._n_items > 0 else 0
             )
         }
     
@@ -244,56 +349,107 @@ class CacheStorage:
         print(f"Process Memory: {stats['process_memory_mb']:.1f}MB")
         print("=" * 80 + "\n")
     
-    async def clear(self):
-        """Clear all cache"""
-        async with self.lock:
-            self.cache.clear()
-            self.access_order.clear()
-            
-            # Clear queue
-            while not self.queue.empty():
+    async def clear(self, table_name: Optional[str] = None):
+        """Clear the cache - everything, or a single table's entries
+
+        A table finishing while others are still running must only drop
+        its own chunks; a full clear would discard chunks the other
+        tables have produced but not yet consumed.
+
+        Args:
+            table_name: Table to clear, or None for a full reset
+        """
+        if table_name is not None:
+            queue = self._queues.pop(table_name, None)
+            if queue is not None:
+                while not queue.empty():
+                    try:
+                        queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+
+            for cache_key, item in [kv for kv in self.cache.items()
+                                    if kv[1].table_name == table_name]:
+                self._lru_unlink(item)
+                del self.cache[cache_key]
+                self._n_items -= 1
+                self._size_bytes -= item.size_bytes
+
+            if (self._above_high_water and
+                    self._size_bytes * 10 < self.max_size_bytes * 7):
+                self._above_high_water = False
+
+            logger.info(f"🗑️  Cache cleared for {table_name}")
+            return
+
+        self.cache.clear()
+        self._lru_head.next = self._lru_tail
+        self._lru_tail.prev = self._lru_head
+
+        # Clear queues
+        for queue in self._queues.values():
+            while not queue.empty():
                 try:
-                    self.queue.get_nowait()
+                    queue.get_nowait()
                 except asyncio.QueueEmpty:
                     break
-            
-            self.stats['current_items'] = 0
-            self.stats['current_size_mb'] = 0
-            
-            logger.info("🗑️  Cache cleared")
+        self._queues.clear()
+
+        self._n_items = 0
+        self._size_bytes = 0
+        self._peak_size_bytes = 0
+        self._above_high_water = False
+        self.high_water_event.clear()
+
+        logger.info("🗑️  Cache cleared")
     
     def is_empty(self) -> bool:
         """Check if cache is empty"""
-        return self.stats['current_items'] == 0
-    
+        return self._n_items == 0
+
     def is_full(self) -> bool:
         """Check if cache is full"""
-        return (self.stats['current_size_mb'] >= self.max_size_mb or 
-                self.stats['current_items'] >= self.max_items)
+        return (self._size_bytes >= self.max_size_bytes or
+                self._n_items >= self.max_items)
 
 
 # Singleton instance - 3GB cache for high performance
 cache_storage = CacheStorage(max_size_mb=3000, max_items=300)
 
 
-async def monitor_cache(interval: int = 10):
-    """
-    Monitor cache storage periodically
-    
-    Args:
-        interval: Monitoring interval in seconds
-    """
+async def _high_water_alarm():
+    """Wait for the cache high-water event and warn immediately"""
+    while True:
+        await cache_storage.high_water_event.wait()
+        cache_storage.high_water_event.clear()
+
+        stats = cache_storage.get_stats()
+        logger.warning(f"⚠️  Cache usage high: {stats['current_size_mb']:.1f}MB / {cache_storage.max_size_mb}MB")
+
+
+async def _stats_logger(interval: int):
+    """Log cache statistics on a coarse timer"""
     while True:
         await asyncio.sleep(interval)
-        
+
         stats = cache_storage.get_stats()
-        
         logger.info(
             f"📦 Cache: {stats['current_items']} items, "
             f"{stats['current_size_mb']:.1f}MB, "
             f"Hit rate: {stats['cache_hit_rate']:.1f}%"
         )
-        
-        # Warning if cache is getting full
-        if stats['current_size_mb'] > cache_storage.max_size_mb * 0.8:
-            logger.warning(f"⚠️  Cache usage high: {stats['current_size_mb']:.1f}MB / {cache_storage.max_size_mb}MB")
+
+
+async def monitor_cache(interval: int = 60):
+    """
+    Monitor cache storage
+
+    High-water warnings are event-driven (fired from put the moment usage
+    crosses 80%, re-armed below 70%) instead of sampled on a timer, so a
+    burst that fills the cache between ticks can no longer go unnoticed
+    and an idle cache costs no wakeups.
+
+    Args:
+        interval: Interval in seconds for the coarse stats log
+    """
+    await asyncio.gather(_high_water_alarm(), _stats_logger(interval))
@@ -0,0 +1,440 @@
+"""
+CDC Stream for ETL Pipeline
+Replicates binlog row events from source to destination in near real-time
+Requires mysql-replication (see requirements.txt) and binlog_format=ROW on the source
+"""
+
+import os
+import time
+import queue
+import logging
+import threading
+from functools import lru_cache
+from typing import Dict, Optional
+
+import mysql.connector
+from mysql.connector import pooling
+from pymysqlreplication import BinLogStreamReader
+from pymysqlreplication.row_event import (
+    DeleteRowsEvent,
+    UpdateRowsEvent,
+    WriteRowsEvent,
+)
+
+logger = logging.getLogger(__name__)
+
+# Queue marker telling an apply worker to flush its own tables' buckets
+_FLUSH = object()
+
+
+def get_env(key: str, default: str = "") -> str:
+    """Get environment variable"""
+    return os.getenv(key, default)
+
+
+# Repeated events for the same table reuse the same SQL string object
+# instead of re-joining identical columns/placeholders every event
+
+@lru_cache(maxsize=512)
+def _upsert_sql(table: str, columns: tuple) -> str:
+    """Build (and cache) the upsert statement for a (table, columns) pair"""
+    columns_str = ", ".join([f"`{col}`" for col in columns])
+    placeholders = ", ".join(["%s"] * len(columns))
+    update_str = ", ".join([f"`{col}`=VALUES(`{col}`)" for col in columns])
+    return (
+        f"INSERT INTO `{table}` ({columns_str}) VALUES ({placeholders}) "
+        f"ON DUPLICATE KEY UPDATE {update_str}"
+    )
+
+
+@lru_cache(maxsize=512)
+def _delete_sql(table: str, columns: tuple) -> str:
+    """Build (and cache) the delete statement for a (table, columns) pair"""
+    where_str = " AND ".join([f"`{col}`=%s" for col in columns])
+    return f"DELETE FROM `{table}` WHERE {where_str}"
+
+
+# One step past string caching: compile a per-(table, op, columns) apply
+# function at first sight, so the SQL is a code-object constant and the
+# flush path is a single call with zero string or dict work
+
+@lru_cache(maxsize=512)
+def _apply_fn(table: str, op: str, columns: tuple):
+    """Compile (and cache) an apply function for a (table, op, columns) triple"""
+    sql = _upsert_sql(table, columns) if op == 'upsert' else _delete_sql(table, columns)
+    namespace = {}
+    exec(
+        f"def _fn(cur, rows):\n    cur.executemany({sql!r}, rows)\n",
+        namespace
+    )
+    return namespace['_fn']
+
+
+class CDCStream:
+    """
+    Change Data Capture stream
+
+    Reads row events (INSERT / UPDATE / DELETE) from the source binlog and
+    applies them to the destination database.
+    """
+
+    def __init__(self, src_params: Dict, dst_params: Dict, server_id: int = 101,
+                 num_workers: int = 4, tables: Optional[list] = None):
+        """
+        Initialize CDC stream
+
+        Args:
+            src_params: Source connection parameters (host, port, user, password, database)
+            dst_params: Destination connection parameters
+            server_id: Unique replication server id for the binlog client
+            num_workers: Apply-worker threads (events are partitioned by table)
+            tables: Optional table whitelist - lets the binlog reader skip
+                    decoding row events for tables the ETL never touches
+        """
+        self.src_params = src_params
+        self.dst_params = dst_params
+        self.server_id = server_id
+        self.tables = tables
+        self.stream: Optional[BinLogStreamReader] = None
+        self.running = False
+
+        # Pipeline: the binlog reader feeds bounded per-worker queues so that
+        # reading the next event overlaps with applying previous ones.
+        # Events are partitioned by table, keeping per-table ordering intact.
+        self.num_workers = num_workers
+        self.event_queues = [queue.Queue(maxsize=64) for _ in range(num_workers)]
+
+        # Pooled destination connections - a fresh TCP + auth handshake per
+        # binlog event costs 10-50ms and caps throughput at ~20-100 events/sec
+        pool_params = {
+            k: v for k, v in dst_params.items()
+            if k in ('host', 'port', 'user', 'password', 'database')
+        }
+        self.pool = pooling.MySQLConnectionPool(
+            pool_name="cdc",
+            pool_size=8,
+            **pool_params
+        )
+
+        # Primary-key columns per table, resolved once on first sight
+        self._pk_cache: Dict[str, list] = {}
+
+        # Coalescing buffers: many tiny binlog events (row-at-a-time OLTP)
+        # are merged into one executemany per (table, op) and flushed every
+        # ~50ms or when a bucket reaches 1000 rows
+        self._pending: Dict[tuple, list] = {}
+        self._pending_cols: Dict[tuple, tuple] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_interval = 0.05
+        self._max_pending_rows = 1000
+
+        # Statistics
+        self.stats = {
+            'inserts': 0,
+            'updates': 0,
+            'deletes': 0,
+            'events': 0
+        }
+        self._event_counter = 0
+
+        logger.info(f"🔁 CDC Stream initialized (server_id={server_id})")
+
+    def connect_stream(self):
+        """Connect to the source binlog stream
+
+        only_events already suppresses everything but row events; passing
+        only_tables on top lets pymysqlreplication drop events for
+        irrelevant tables right after the table map, before row decoding.
+        """
+        self.stream = BinLogStreamReader(
+            connection_settings={
+                'host': self.src_params['host'],
+                'port': self.src_params['port'],
+                'user': self.src_params['user'],
+                'passwd': self.src_params['password'],
+            },
+            server_id=self.server_id,
+            only_schemas=[self.src_params['database']],
+            only_tables=self.tables,
+            only_events=[WriteRowsEvent, UpdateRowsEvent, DeleteRowsEvent],
+            blocking=True,
+            resume_stream=True,
+        )
+        logger.info(f"🔁 CDC connected to binlog of {self.src_params['host']}:{self.src_params['port']}")
+
+    def _get_pk_columns(self, table: str) -> list:
+        """Get (and cache) the primary key columns of a destination table"""
+        if table not in self._pk_cache:
+            cnx = self.pool.get_connection()
+            try:
+                cur = cnx.cursor()
+                cur.execute(f"SHOW KEYS FROM `{table}` WHERE Key_name = 'PRIMARY'")
+                self._pk_cache[table] = [row[4] for row in cur.fetchall()]
+            except Exception as e:
+                logger.warning(f"⚠️  Could not resolve PK for {table}: {e}")
+                self._pk_cache[table] = []
+            finally:
+                cnx.close()
+        return self._pk_cache[table]
+
+    def _take_bucket(self, key: tuple):
+        """Detach one (table, op) bucket for execution
+
+        Caller must hold self._pending_lock. Returns (params, columns)
+        or None if the bucket is empty.
+        """
+        params = self._pending.pop(key, None)
+        columns = self._pending_cols.pop(key, None)
+        if not params:
+            return None
+        return params, columns
+
+    def _execute_bucket(self, key: tuple, params: list, columns: tuple):
+        """Execute one coalesced executemany for a detached bucket
+
+        Runs WITHOUT self._pending_lock held - the executemany + commit
+        round trip must not serialize every apply worker on the buffer
+        lock. Per-table ordering holds because a table's buckets are only
+        ever executed on its owning worker thread (the flush timer posts
+        _FLUSH markers instead of executing).
+        """
+        table, op = key
+        apply_fn = _apply_fn(table, op, columns)
+
+        cnx = self.pool.get_connection()
+        try:
+            cur = cnx.cursor()
+            apply_fn(cur, params)
+            cnx.commit()
+            logger.debug(f"🔁 CDC flushed {len(params)} {op} rows to {table}")
+        except Exception as e:
+            logger.error(f"❌ CDC {op} error on {table}: {e}")
+            cnx.rollback()
+        finally:
+            cnx.close()  # returns connection to pool
+
+    def _owns(self, worker_id: int, table: str) -> bool:
+        """True if this worker's queue receives the given table's events"""
+        return hash(table) % self.num_workers == worker_id
+
+    def _buffer(self, op: str, table: str, columns: tuple, rows: list):
+        """Buffer rows for coalesced flushing, preserving per-table op order"""
+        to_flush = []
+        with self._pending_lock:
+            # An earlier event of the other op (or another column shape) for
+            # this table must land first
+            for existing in list(self._pending.keys()):
+                if existing[0] == table and existing[1] != op:
+                    bucket = self._take_bucket(existing)
+                    if bucket:
+                        to_flush.append((existing,) + bucket)
+
+            key = (table, op)
+            if key in self._pending and self._pending_cols[key] != columns:
+                bucket = self._take_bucket(key)
+                if bucket:
+                    to_flush.append((key,) + bucket)
+
+            self._pending.setdefault(key, []).extend(rows)
+            self._pending_cols[key] = columns
+
+            if len(self._pending[key]) >= self._max_pending_rows:
+                bucket = self._take_bucket(key)
+                if bucket:
+                    to_flush.append((key,) + bucket)
+
+        # Execute outside the lock; all buckets here belong to tables this
+        # worker owns, so they run in take-order on this one thread
+        for key, params, columns in to_flush:
+            self._execute_bucket(key, params, columns)
+
+    def _flush_pending(self, worker_id: Optional[int] = None):
+        """Flush coalescing buffers - one worker's tables, or all of them
+
+        Args:
+            worker_id: Flush only buckets whose table this worker owns;
+                None flushes everything (shutdown, after workers joined)
+        """
+        to_flush = []
+        with self._pending_lock:
+            for key in list(self._pending.keys()):
+                if worker_id is not None and not self._owns(worker_id, key[0]):
+                    continue
+                bucket = self._take_bucket(key)
+                if bucket:
+                    to_flush.append((key,) + bucket)
+
+        for key, params, columns in to_flush:
+            self._execute_bucket(key, params, columns)
+
+    def _flush_loop(self):
+        """Timer thread: ask each apply worker to flush its buckets
+
+        The timer never executes DML itself - running a bucket on this
+        thread could commit it out of order against a bucket the owning
+        worker detached moments later. Posting a marker through the
+        worker's own event queue keeps every execution for a table on
+        the one thread that buffers it.
+        """
+        while self.running:
+            time.sleep(self._flush_interval)
+            for q in self.event_queues:
+                try:
+                    q.put_nowait(_FLUSH)
+                except queue.Full:
+                    pass  # worker is busy; its backlog will flush anyway
+
+    def handle_insert(self, event):
+        """Buffer a WriteRowsEvent for coalesced upsert"""
+        if not event.rows:
+            return
+
+        # All rows in one binlog event share the same column schema
+        columns = tuple(event.rows[0]['values'].keys())
+        rows = [tuple(row['values'].values()) for row in event.rows]
+        self._buffer('upsert', event.table, columns, rows)
+        self.stats['inserts'] += len(rows)
+
+    def handle_update(self, event):
+        """Buffer an UpdateRowsEvent for coalesced upsert (after-values)"""
+        if not event.rows:
+            return
+
+        columns = tuple(event.rows[0]['after_values'].keys())
+        rows = [tuple(row['after_values'].values()) for row in event.rows]
+        self._buffer('upsert', event.table, columns, rows)
+        self.stats['updates'] += len(rows)
+
+    def handle_delete(self, event):
+        """Buffer a DeleteRowsEvent for coalesced delete"""
+        if not event.rows:
+            return
+
+        pk_columns = self._get_pk_columns(event.table)
+        if pk_columns:
+            # Match on the primary key only: the clustered index is used,
+            # the parameter list stays small, and NULL-valued non-key
+            # columns cannot break the match (col = NULL never matches)
+            columns = tuple(pk_columns)
+            rows = [
+                tuple(row['values'][col] for col in pk_columns)
+                for row in event.rows
+            ]
+            self._buffer('delete', event.table, columns, rows)
+        else:
+            # No PK: fall back to matching all columns, grouped by column
+            # set (WHERE shape) so each group coalesces on its own
+            groups: Dict[tuple, list] = {}
+            for row in event.rows:
+                values = row['values']
+                groups.setdefault(tuple(values.keys()), []).append(tuple(values.values()))
+
+            for columns, group_rows in groups.items():
+                self._buffer('delete', event.table, columns, group_rows)
+
+        self.stats['deletes'] += len(event.rows)
+
+    def _dispatch(self, event):
+        """Apply a single binlog event to the destination"""
+        if isinstance(event, WriteRowsEvent):
+            self.handle_insert(event)
+        elif isinstance(event, UpdateRowsEvent):
+            self.handle_update(event)
+        elif isinstance(event, DeleteRowsEvent):
+            self.handle_delete(event)
+
+        self.stats['events'] += 1
+
+        # Power-of-two mask: one AND per event instead of three dict
+        # lookups, two adds, and a modulo
+        self._event_counter += 1
+        if self._event_counter & 127 == 0:
+            logger.info(
+                f"🔁 CDC: {self.stats['inserts']:,} inserts, "
+                f"{self.stats['updates']:,} updates, "
+                f"{self.stats['deletes']:,} deletes"
+            )
+
+    def _apply_worker(self, worker_id: int):
+        """Worker thread: drain one event queue and execute the DML"""
+        q = self.event_queues[worker_id]
+        while True:
+            event = q.get()
+            if event is None:
+                break
+            try:
+                if event is _FLUSH:
+                    self._flush_pending(worker_id)
+                else:
+                    self._dispatch(event)
+            except Exception as e:
+                logger.error(f"❌ CDC worker-{worker_id} error: {e}")
+            finally:
+                q.task_done()
+
+    def run(self):
+        """Blocking loop: read binlog events and hand them to apply workers"""
+        if self.stream is None:
+            self.connect_stream()
+
+        self.running = True
+
+        workers = [
+            threading.Thread(target=self._apply_worker, args=(i,), daemon=True)
+            for i in range(self.num_workers)
+        ]
+        for w in workers:
+            w.start()
+
+        flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        flusher.start()
+
+        logger.info(f"🔁 CDC stream running ({self.num_workers} apply workers)...")
+
+        try:
+            for event in self.stream:
+                if not self.running:
+                    break
+                # Same table -> same worker, so per-table ordering is preserved
+                self.event_queues[hash(event.table) % self.num_workers].put(event)
+        finally:
+            for q in self.event_queues:
+                q.put(None)
+            for w in workers:
+                w.join()
+            self.running = False
+            self._flush_pending()
+
+    def stop(self):
+        """Stop the CDC stream"""
+        self.running = False
+        if self.stream:
+            self.stream.close()
+        logger.info("🔁 CDC stream stopped")
+
+
+def get_connection_params(prefix: str) -> Dict:
+    """Get database connection parameters from .env"""
+    return {
+        "host": get_env(f"{prefix}_DB_HOST"),
+        "port": int(get_env(f"{prefix}_DB_PORT", "3306")),
+        "database": get_env(f"{prefix}_DB_NAME"),
+        "user": get_env(f"{prefix}_DB_USER"),
+        "password": get_env(f"{prefix}_DB_PASSWORD"),
+    }
+
+
+if __name__ == "__main__":
+    import sys
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+
+    cdc = CDCStream(
+        src_params=get_connection_params("SRC"),
+        dst_params=get_connection_params("DST"),
+        server_id=int(get_env("CDC_SERVER_ID", "101")),
+    )
+    cdc.run()
@@ -1,9 +1,60 @@
+import time
 import mysql.connector
-from typing import List, Tuple
+from mysql.connector import pooling
+from itertools import groupby
+from typing import Dict, List, Tuple
+
+# Metadata changes rarely but is asked for constantly while the ETL walks a
+# schema, so results are cached in-process with a short TTL
+_CACHE_TTL = 60.0
+_cache = {}
+
+
+def _conn_key(conn_params) -> tuple:
+    return (
+        conn_params.get("host"),
+        conn_params.get("port"),
+        conn_params.get("user"),
+        conn_params.get("database"),
+    )
+
+
+def _cache_get(key):
+    entry = _cache.get(key)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+    return None
+
+
+def _cache_put(key, value):
+    _cache[key] = (value, time.monotonic() + _CACHE_TTL)
+    return value
+
+
+# Pooled connections per target - metadata calls otherwise pay a TCP +
+# auth handshake each time, which dominates when enumerating many tables
+_pools = {}
+
+
+def _get_connection(conn_params):
+    key = _conn_key(conn_params)
+    pool = _pools.get(key)
+    if pool is None:
+        pool = _pools[key] = pooling.MySQLConnectionPool(
+            pool_name=f"metadata_{len(_pools)}",
+            pool_size=5,
+            **conn_params,
+        )
+    return pool.get_connection()
 
 
 def get_tables(conn_params) -> List[Tuple[str, str]]:
-    cnx = mysql.connector.connect(**conn_params)
+    key = ("tables", _conn_key(conn_params))
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    cnx = _get_connection(conn_params)
     try:
         cur = cnx.cursor()
         cur.execute(
@@ -15,30 +66,75 @@ def get_tables(conn_params) -> List[Tuple[str, str]]:
             """,
             (conn_params["database"],),
         )
-        return cur.fetchall()
+        return _cache_put(key, cur.fetchall())
     finally:
         cnx.close()
 
 
-def get_primary_key_columns(conn_params, schema: str, table: str) -> List[str]:
-    cnx = mysql.connector.connect(**conn_params)
+def get_primary_key_columns_bulk(conn_params, schema: str) -> Dict[str, List[str]]:
+    key = ("pk_bulk", _conn_key(conn_params), schema)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    cnx = _get_connection(conn_params)
     try:
         cur = cnx.cursor()
         cur.execute(
             """
-            SELECT k.COLUMN_NAME
+            SELECT k.TABLE_NAME, k.COLUMN_NAME
             FROM information_schema.table_constraints t
             JOIN information_schema.key_column_usage k
               ON t.CONSTRAINT_NAME = k.CONSTRAINT_NAME
              AND t.TABLE_SCHEMA = k.TABLE_SCHEMA
              AND t.TABLE_NAME = k.TABLE_NAME
             WHERE t.TABLE_SCHEMA = %s
-              AND t.TABLE_NAME = %s
               AND t.CONSTRAINT_TYPE = 'PRIMARY KEY'
-            ORDER BY k.ORDINAL_POSITION
+            ORDER BY k.TABLE_NAME, k.ORDINAL_POSITION
             """,
-            (schema, table),
+            (schema,),
         )
-        return [r[0] for r in cur.fetchall()]
+        pk_map = {
+            table: [r[1] for r in rows]
+            for table, rows in groupby(cur.fetchall(), key=lambda r: r[0])
+        }
+        return _cache_put(key, pk_map)
     finally:
         cnx.close()
+
+
+def get_column_types_bulk(conn_params, schema: str) -> Dict[str, Dict[str, str]]:
+    key = ("col_types", _conn_key(conn_params), schema)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    cnx = _get_connection(conn_params)
+    try:
+        cur = cnx.cursor()
+        cur.execute(
+            """
+            SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE
+            FROM information_schema.columns
+            WHERE TABLE_SCHEMA = %s
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """,
+            (schema,),
+        )
+        type_map = {
+            table: {r[1]: r[2] for r in rows}
+            for table, rows in groupby(cur.fetchall(), key=lambda r: r[0])
+        }
+        return _cache_put(key, type_map)
+    finally:
+        cnx.close()
+
+
+def get_column_types(conn_params, schema: str, table: str) -> Dict[str, str]:
+    return get_column_types_bulk(conn_params, schema).get(table, {})
+
+
+def get_primary_key_columns(conn_params, schema: str, table: str) -> List[str]:
+    # One schema-wide query (cached) instead of a connection per table -
+    # enumerating PKs for N tables costs one round trip, not N
+    return get_primary_key_columns_bulk(conn_params, schema).get(table, [])
@@ -9,20 +9,30 @@ Optimized for Medical Database (smartmedkku_2025.10.11)
 import os
 import sys
 import time
+import tempfile
+import hashlib
 import logging
+import logging.handlers
+import queue
+import atexit
 import threading
 import asyncio
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
 import mysql.connector
+import psutil
 import pandas as pd
 import numpy as np
+
+# Give Polars' rayon pool all physical cores (must be set before import)
+os.environ.setdefault("POLARS_MAX_THREADS", str(os.cpu_count() or 4))
 import polars as pl
+import connectorx as cx
 import aiomysql
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
 from urllib.parse import quote_plus
+from functools import lru_cache
 
 # Import cache storage
 from cache_storage import cache_storage, monitor_cache
@@ -32,7 +42,7 @@ load_dotenv()
 
 # Import monitor (optional - won't crash if not available)
 try:
-    from monitor import start_monitor_server, update_state, get_state, add_log
+    from monitor import start_monitor_server, update_state, get_state, add_log, mutate_table_status, incr_table_counter
     MONITOR_AVAILABLE = True
 except ImportError:
     MONITOR_AVAILABLE = False
@@ -41,7 +51,7 @@ except ImportError:
     def add_log(*args, **kwargs): pass
 
 # Import metadata helper
-from db_metadata import get_tables, get_primary_key_columns
+from db_metadata import get_tables, get_primary_key_columns, get_column_types
 
 # -----------------------------------------
 # 🔹 LOGGING CONFIGURATION
@@ -49,25 +59,46 @@ from db_metadata import get_tables, get_primary_key_columns
 log_dir = "logs"
 os.makedirs(log_dir, exist_ok=True)
 
+# Log records go through an in-memory queue; the listener thread does the
+# actual stream/file writes so coroutines never block on disk I/O
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler(f"{log_dir}/etl_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"),
+    respect_handler_level=True
+)
+
 logging.basicConfig(
     level=os.getenv("LOG_LEVEL", "INFO"),
     format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(f"{log_dir}/etl_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Transforms run on a tiny dedicated gate pool: Polars does the real work
+# on its own rayon threads (GIL released in Rust), so sharing the default
+# executor with extract/load threads only starves it
+_polars_gate = ThreadPoolExecutor(max_workers=2, thread_name_prefix="polars-gate")
+
 
 # -----------------------------------------
 # 🔹 CONFIGURATION
 # -----------------------------------------
+@lru_cache(maxsize=None)
 def get_env(key: str, default: str = "") -> str:
-    """Get environment variable."""
+    """Get environment variable (cached - .env is loaded once at import)."""
     return os.getenv(key, default)
 
 
+@lru_cache(maxsize=None)
+def get_env_int(key: str, default: int) -> int:
+    """Get an integer environment variable, parsed once per process."""
+    return int(get_env(key, str(default)))
+
+
 def get_dynamic_db_name() -> str:
     """
     Get dynamic database name with date/time placeholders replaced
@@ -117,8 +148,8 @@ def calculate_dynamic_config(total_rows: int) -> dict:
         dict with stable batch_size, num_producers, num_consumers
     """
     # Get configuration (conservative defaults)
-    batch_size = int(get_env("BATCH_SIZE", "5000"))
-    max_workers = int(get_env("MAX_WORKERS", "20"))
+    batch_size = get_env_int("BATCH_SIZE", 5000)
+    max_workers = get_env_int("MAX_WORKERS", 20)
     
     # Use FIXED conservative configuration for stability
     # Focus: Complete all tables reliably, not speed
@@ -212,7 +243,14 @@ async def init_db_pools():
         autocommit=False,
         charset='utf8mb4',
         connect_timeout=60,
-        pool_recycle=3600
+        pool_recycle=3600,
+        local_infile=True,
+        # Bulk-load session flags set once per connection instead of two
+        # round-trips per load call; they die with the session at shutdown
+        init_command=(
+            "SET SESSION foreign_key_checks=0, unique_checks=0, "
+            "bulk_insert_buffer_size=33554432"
+        )
     )
     
     logger.info("✅ Database pools initialized (SRC: 2-10, DST: 3-15 connections - STABLE MODE)")
@@ -285,8 +323,23 @@ def get_latest_database(host: str, port: int, user: str, password: str, pattern:
         raise
 
 
+@lru_cache(maxsize=4)
+def _connection_params_cached(prefix: str) -> tuple:
+    """Resolve connection parameters once per prefix (frozen as items)"""
+    return tuple(_resolve_connection_params(prefix).items())
+
+
 def get_connection_params(prefix: str) -> Dict:
-    """Get database connection parameters from .env"""
+    """Get database connection parameters from .env (cached per prefix)
+
+    Resolution can hit the network (LATEST: pattern lookup), so the result
+    is cached for the run; callers get a fresh dict they may mutate.
+    """
+    return dict(_connection_params_cached(prefix))
+
+
+def _resolve_connection_params(prefix: str) -> Dict:
+    """Resolve database connection parameters from .env"""
     db_name = None
     
     # Use dynamic database name for destination
@@ -330,75 +383,49 @@ def get_connection_params(prefix: str) -> Dict:
     }
 
 
-def get_sqlalchemy_engine(prefix: str):
-    """Get SQLAlchemy engine for pandas (no warnings)"""
-    params = get_connection_params(prefix)
-    
-    # URL encode password to handle special characters
-    password = quote_plus(params['password'])
-    
-    # Build connection string
-    connection_string = (
-        f"mysql+pymysql://{params['user']}:{password}@"
-        f"{params['host']}:{params['port']}/{params['database']}"
-        f"?charset=utf8mb4"
-    )
-    
-    # Create engine with connection pooling
-    engine = create_engine(
-        connection_string,
-        pool_size=5,
-        max_overflow=10,
-        pool_pre_ping=True,  # Verify connections before using
-        pool_recycle=3600,  # Recycle connections after 1 hour
-        echo=False
-    )
-    
-    return engine
+async def _ensure_db_pools():
+    """Lazily initialize the shared aiomysql pools"""
+    if db_pool_src is None or db_pool_dst is None:
+        await init_db_pools()
 
 
-def configure_session(connection, is_source=False):
-    """Configure session variables for maximum performance"""
-    try:
-        cursor = connection.cursor()
-        
-        if is_source:
-            # Source: READ optimizations
-            cursor.execute("SET SESSION transaction_isolation = 'READ-UNCOMMITTED'")
-            cursor.execute("SET SESSION net_read_timeout = 3600")
-            cursor.execute("SET SESSION net_write_timeout = 3600")
-            cursor.execute("SET SESSION max_execution_time = 0")
-            try:
-                cursor.execute("SET SESSION read_buffer_size = 4194304")  # 4MB
-                cursor.execute("SET SESSION read_rnd_buffer_size = 4194304")
-                cursor.execute("SET SESSION sort_buffer_size = 4194304")
-            except:
-                pass
-        else:
-            # Destination: WRITE optimizations
-            try:
-                cursor.execute("SET SESSION innodb_lock_wait_timeout = 300")
-                cursor.execute("SET SESSION transaction_isolation = 'READ-COMMITTED'")
-                cursor.execute("SET SESSION unique_checks = 0")
-                cursor.execute("SET SESSION foreign_key_checks = 0")
-                cursor.execute("SET SESSION autocommit = 0")
-                cursor.execute("SET SESSION net_read_timeout = 3600")
-                cursor.execute("SET SESSION net_write_timeout = 3600")
-                cursor.execute("SET SESSION bulk_insert_buffer_size = 33554432")  # 32MB
-            except Exception as e:
-                logger.debug(f"Some optimizations not available: {e}")
-        
-        cursor.close()
-    except Exception as e:
-        pass
+async def _fetch_dataframe(query: str, params=None) -> pd.DataFrame:
+    """
+    Run a SELECT on the shared source pool and return a DataFrame
+
+    All extract traffic goes through db_pool_src - one pool's worth of
+    sockets and server sessions instead of a SQLAlchemy pool per engine
+    plus ad-hoc mysql.connector sessions.
+    """
+    await _ensure_db_pools()
+    async with db_pool_src.acquire() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(query, params)
+            rows = await cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+    return pd.DataFrame(rows, columns=columns)
 
 
 # -----------------------------------------
 # 🔹 STEP 1: EXTRACT WITH LIMIT/OFFSET (ASYNC)
 # -----------------------------------------
+def get_connectorx_uri(prefix: str) -> str:
+    """Get ConnectorX connection URI"""
+    params = get_connection_params(prefix)
+    password = quote_plus(params['password'])
+    return (
+        f"mysql://{params['user']}:{password}@"
+        f"{params['host']}:{params['port']}/{params['database']}"
+    )
+
+
 async def extract_chunk_with_offset_polars(table: str, offset: int, limit: int) -> pl.DataFrame:
     """
-    Extract data chunk using Polars (5-10x faster than Pandas)
+    Extract data chunk straight into Arrow via ConnectorX (5-10x faster than Pandas)
+
+    ConnectorX streams MySQL rows directly into Arrow columnar buffers,
+    so Polars gets the chunk zero-copy - no Python row objects and no
+    Pandas→Polars round-trip doubling peak memory.
     
     Args:
         table: Table name
@@ -409,27 +436,34 @@ async def extract_chunk_with_offset_polars(table: str, offset: int, limit: int)
         Polars DataFrame
     """
     try:
-        # Use Pandas first to handle MySQL datetime issues, then convert to Polars
         loop = asyncio.get_event_loop()
         
-        # Extract with Pandas (handles invalid datetime)
-        df_pandas = await extract_chunk_with_offset(table, offset, limit)
+        conn_uri = await loop.run_in_executor(None, get_connectorx_uri, "SRC")
+        query = f"SELECT * FROM `{table}` LIMIT {limit} OFFSET {offset}"
         
-        # Convert to Polars (faster processing)
-        def _to_polars():
-            return pl.from_pandas(df_pandas)
+        def _read_arrow():
+            arrow_table = cx.read_sql(conn_uri, query, return_type="arrow2", protocol="binary")
+            return pl.from_arrow(arrow_table)
         
-        df = await loop.run_in_executor(None, _to_polars)
+        df = await loop.run_in_executor(None, _read_arrow)
         
-        logger.debug(f"📥 Extracted {len(df):,} rows using Polars (offset={offset})")
+        logger.debug("📥 Extracted %d rows using ConnectorX (offset=%d)", len(df), offset)
         
         return df
         
     except Exception as e:
-        logger.error(f"✗ Error extracting chunk from {table}: {e}")
-        if MONITOR_AVAILABLE:
-            add_log(f"Extract error: {table} - {str(e)[:100]}", "ERROR")
-        raise
+        logger.warning(f"⚠️  ConnectorX extract failed for {table} ({str(e)[:100]}), falling back to Pandas")
+        
+        try:
+            # Fallback: Pandas path (handles invalid datetime like 0000-00-00)
+            loop = asyncio.get_event_loop()
+            df_pandas = await extract_chunk_with_offset(table, offset, limit)
+            return await loop.run_in_executor(None, pl.from_pandas, df_pandas)
+        except Exception as e:
+            logger.error(f"✗ Error extracting chunk from {table}: {e}")
+            if MONITOR_AVAILABLE:
+                add_log(f"Extract error: {table} - {str(e)[:100]}", "ERROR")
+            raise
 
 async def extract_chunk_with_offset(table: str, offset: int, limit: int) -> pd.DataFrame:
     """
@@ -443,52 +477,87 @@ async def extract_chunk_with_offset(table: str, offset: int, limit: int) -> pd.D
     Returns:
         DataFrame with extracted chunk
     """
-    engine = None
     try:
-        loop = asyncio.get_event_loop()
-        engine = await loop.run_in_executor(None, get_sqlalchemy_engine, "SRC")
-        
         # Build query with LIMIT/OFFSET
         query = f"SELECT * FROM `{table}` LIMIT {limit} OFFSET {offset}"
         
-        logger.info(f"📥 Extracting chunk from {table} (offset={offset:,}, limit={limit:,})...")
-        
-        # Read data chunk (async)
-        def _read_sql():
-            return pd.read_sql(query, engine)
+        logger.info("📥 Extracting chunk from %s (offset=%d, limit=%d)...", table, offset, limit)
         
-        df = await loop.run_in_executor(None, _read_sql)
+        df = await _fetch_dataframe(query)
         
-        logger.info(f"✓ Extracted {len(df):,} records from {table} (offset={offset:,})")
+        logger.info("✓ Extracted %d records from %s (offset=%d)", len(df), table, offset)
         
         return df
         
     except Exception as e:
         logger.error(f"✗ Error extracting chunk from {table}: {e}")
         raise
-    finally:
-        if engine:
-            engine.dispose()
 
 
-async def extract_data(table: str, chunk_size: int = 50000, limit: Optional[int] = None) -> pd.DataFrame:
+@lru_cache(maxsize=512)
+def _keyset_queries(table: str, pk_columns: tuple, limit: int) -> Tuple[str, str]:
+    """Build (first-chunk, seek-chunk) keyset SELECTs once per table"""
+    pk_str = ", ".join([f"`{col}`" for col in pk_columns])
+    base = f"SELECT * FROM `{table}`"
+    tail = f" ORDER BY {pk_str} LIMIT {limit}"
+    row_placeholder = "(" + ", ".join(["%s"] * len(pk_columns)) + ")"
+    return base + tail, base + f" WHERE ({pk_str}) > {row_placeholder}" + tail
+
+
+async def extract_chunk_keyset(table: str, pk_columns: List[str], last_pk: Optional[tuple], limit: int) -> pd.DataFrame:
     """
-    Extract data from source database using Pandas + SQLAlchemy
-    
+    Extract the next data chunk using keyset (PK-range) pagination
+
+    LIMIT/OFFSET makes MySQL scan and throw away `offset` rows per chunk,
+    which is quadratic over a whole table. Seeking from the last-seen PK
+    uses the clustered index directly, so every chunk costs O(log N + n).
+
     Args:
         table: Table name to extract
-        chunk_size: Number of rows per chunk
-        limit: Optional limit for testing
-    
+        pk_columns: Primary key columns (scan order)
+        last_pk: PK tuple of the last row of the previous chunk, or None
+                 for the first chunk
+        limit: Number of rows to fetch
+
     Returns:
-        DataFrame with extracted data
+        DataFrame with extracted chunk (ordered by PK)
+    """
+    try:
+        first_query, seek_query = _keyset_queries(table, tuple(pk_columns), limit)
+        if last_pk is None:
+            query, params = first_query, None
+        else:
+            query, params = seek_query, tuple(last_pk)
+
+        logger.info(f"📥 Extracting chunk from {table} (keyset after {last_pk})...")
+
+        df = await _fetch_dataframe(query, params)
+
+        logger.info("✓ Extracted %d records from %s (keyset)", len(df), table)
+
+        return df
+
+    except Exception as e:
+        logger.error(f"✗ Error extracting chunk from {table}: {e}")
+        raise
+
+
+async def extract_data_iter(table: str, chunk_size: int = 50000, limit: Optional[int] = None):
+    """
+    Stream a table from the source pool chunk by chunk
+
+    Yields chunks as they arrive so callers can pipe them straight into
+    transform/load without ever holding the whole table in memory.
+
+    Args:
+        table: Table name to extract
+        chunk_size: Number of rows per fetch batch
+        limit: Optional limit for testing
+
+    Yields:
+        DataFrame chunks
     """
-    engine = None
     try:
-        # Get SQLAlchemy engine (no warnings!)
-        loop = asyncio.get_event_loop()
-        engine = await loop.run_in_executor(None, get_sqlalchemy_engine, "SRC")
-        
         # Build query
         query = f"SELECT * FROM `{table}`"
         if limit:
@@ -496,43 +565,64 @@ async def extract_data(table: str, chunk_size: int = 50000, limit: Optional[int]
         
         logger.info(f"📥 Extracting data from {table}...")
         
-        # Read data in chunks (async)
-        def _read_sql():
-            chunks = []
-            for chunk in pd.read_sql(query, engine, chunksize=chunk_size):
-                chunks.append(chunk)
-                logger.info(f"  Extracted chunk: {len(chunk):,} rows")
-            return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
-        
-        df = await loop.run_in_executor(None, _read_sql)
-        
-        logger.info(f"✓ Extracted {len(df):,} records from {table}")
-        
-        if MONITOR_AVAILABLE:
-            add_log(f"Extracted {len(df):,} rows from {table}", "INFO")
-        
-        return df
+        await _ensure_db_pools()
+        async with db_pool_src.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query)
+                columns = [desc[0] for desc in cursor.description]
+                
+                while True:
+                    rows = await cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    logger.info(f"  Extracted chunk: {len(rows):,} rows")
+                    yield pd.DataFrame(rows, columns=columns)
         
     except Exception as e:
         logger.error(f"✗ Error extracting from {table}: {e}")
         if MONITOR_AVAILABLE:
             add_log(f"Extract error: {table} - {str(e)[:100]}", "ERROR")
         raise
-    finally:
-        if engine:
-            engine.dispose()
+
+
+async def extract_data(table: str, chunk_size: int = 50000, limit: Optional[int] = None) -> pd.DataFrame:
+    """
+    Extract a whole table as one DataFrame (streaming under the hood)
+    
+    Args:
+        table: Table name to extract
+        chunk_size: Number of rows per fetch batch
+        limit: Optional limit for testing
+    
+    Returns:
+        DataFrame with extracted data
+    """
+    chunks = [chunk async for chunk in extract_data_iter(table, chunk_size, limit)]
+    
+    # copy=False reuses the chunk blocks instead of re-allocating them,
+    # so concatenation does not double peak memory
+    df = pd.concat(chunks, ignore_index=True, copy=False) if chunks else pd.DataFrame()
+    
+    logger.info(f"✓ Extracted {len(df):,} records from {table}")
+    
+    if MONITOR_AVAILABLE:
+        add_log(f"Extracted {len(df):,} rows from {table}", "INFO")
+    
+    return df
 
 
 # -----------------------------------------
 # 🔹 STEP 2: TRANSFORM (ASYNC)
 # -----------------------------------------
-async def transform_data_polars(df: pl.DataFrame, table: str) -> pl.DataFrame:
+async def transform_data_polars(df: pl.DataFrame, table: str, pk_columns: Optional[List[str]] = None) -> pl.DataFrame:
     """
     Transform data using Polars (5-10x faster than Pandas)
     
     Args:
         df: Polars DataFrame
         table: Table name
+        pk_columns: Primary key columns - dedup hashes only these instead
+                    of every cell in the row; an empty list skips dedup
         
     Returns:
         Transformed Polars DataFrame
@@ -546,50 +636,60 @@ async def transform_data_polars(df: pl.DataFrame, table: str) -> pl.DataFrame:
             nonlocal df
             original_count = len(df)
             
-            # 1. Remove duplicates (Polars is much faster)
-            df = df.unique()
-            duplicates_removed = original_count - len(df)
-            if duplicates_removed > 0:
-                logger.info(f"  Removed {duplicates_removed:,} duplicate rows")
-            
-            # 2. Clean string columns - strip whitespace
+            # Classify columns once
             string_cols = [col for col in df.columns if df[col].dtype == pl.Utf8]
-            if string_cols:
-                df = df.with_columns([
-                    pl.col(col).str.strip_chars() for col in string_cols
-                ])
-            
-            # 3. Fill nulls in numeric columns
             numeric_cols = [col for col in df.columns if df[col].dtype in [pl.Float64, pl.Float32, pl.Int64, pl.Int32]]
-            if numeric_cols:
-                df = df.with_columns([
-                    pl.col(col).fill_null(0) for col in numeric_cols
-                ])
-            
-            # 4. Replace NaN and Inf in float columns
             float_cols = [col for col in df.columns if df[col].dtype in [pl.Float64, pl.Float32]]
-            if float_cols:
-                for col in float_cols:
-                    df = df.with_columns([
-                        pl.when(pl.col(col).is_nan() | pl.col(col).is_infinite())
-                        .then(pl.lit(0.0))
-                        .otherwise(pl.col(col))
-                        .alias(col)
-                    ])
             
-            # 5. Data quality report
-            null_counts = df.null_count()
-            total_nulls = sum(null_counts.row(0))
-            if total_nulls > 0:
-                logger.info(f"  NULL values found:")
-                for i, col in enumerate(df.columns):
-                    count = null_counts.row(0)[i]
+            # One fused pipeline: dedup + strip + fill_null + NaN/Inf cleanup.
+            # The old code ran these as five eager passes, materializing a
+            # fresh frame each time; the lazy plan collapses them into a
+            # single streaming pass over the data.
+            exprs = [pl.col(col).str.strip_chars() for col in string_cols]
+            exprs += [
+                pl.col(col).fill_null(0)
+                for col in numeric_cols if col not in float_cols
+            ]
+            exprs += [
+                pl.when(pl.col(col).is_nan() | pl.col(col).is_infinite())
+                .then(pl.lit(0.0))
+                .otherwise(pl.col(col))
+                .fill_null(0.0)
+                .alias(col)
+                for col in float_cols
+            ]
+            
+            # Dedup on the PK when we know it - hashing 2 key cells beats
+            # hashing all 100 on wide tables. No PK at all means we cannot
+            # safely pick a survivor, so skip dedup.
+            lf = df.lazy()
+            if pk_columns:
+                dedup_keys = [col for col in pk_columns if col in df.columns]
+                if dedup_keys:
+                    lf = lf.unique(subset=dedup_keys, keep='last', maintain_order=False)
+            elif pk_columns is None:
+                lf = lf.unique()
+            if exprs:
+                lf = lf.with_columns(exprs)
+            df = lf.collect(engine="streaming")
+            
+            duplicates_removed = original_count - len(df)
+            if duplicates_removed > 0:
+                logger.info(f"  Removed {duplicates_removed:,} duplicate rows")
+            
+            # Data quality report - opt-in only: the counts cost another
+            # full scan, as expensive as the transform itself
+            if os.getenv('ETL_NULL_REPORT', '0') == '1':
+                null_counts = df.lazy().select(
+                    [pl.col(col).null_count().alias(col) for col in df.columns]
+                ).collect().row(0)
+                for col, count in zip(df.columns, null_counts):
                     if count > 0:
                         logger.info(f"    - {col}: {count:,} NULLs")
             
             return df
         
-        df = await loop.run_in_executor(None, _transform_polars)
+        df = await loop.run_in_executor(_polars_gate, _transform_polars)
         
         logger.info(f"✓ Transformation complete: {len(df):,} rows (Polars)")
         
@@ -604,7 +704,7 @@ async def transform_data_polars(df: pl.DataFrame, table: str) -> pl.DataFrame:
             add_log(f"Transform error: {table} - {str(e)[:100]}", "ERROR")
         raise
 
-async def transform_data(df: pd.DataFrame, table: str) -> pd.DataFrame:
+async def transform_data(df: pd.DataFrame, table: str, pk_columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Transform data with quality checks (AWS Glue style)
     
@@ -620,19 +720,51 @@ async def transform_data(df: pd.DataFrame, table: str) -> pd.DataFrame:
         # Run transformation in thread pool (CPU-bound)
         loop = asyncio.get_event_loop()
         
+        # Schema-driven casts: real types from information_schema (cached)
+        # beat per-column sniffing - format='mixed' falls back to Python-level
+        # datetime parsing, ~50x slower than a fixed format
+        def _column_types():
+            try:
+                src_params = get_connection_params("SRC")
+                return get_column_types(src_params, src_params['database'], table)
+            except Exception as e:
+                logger.debug(f"Column metadata unavailable for {table}: {e}")
+                return {}
+        
+        col_types = await loop.run_in_executor(None, _column_types)
+        
         def _transform():
             nonlocal df
             original_count = len(df)
             
-            # 1. Remove exact duplicates
-            df = df.drop_duplicates()
+            # 1. Remove duplicates - keyed on the PK when known, so only
+            # the key cells are hashed; no PK at all skips dedup
+            if pk_columns:
+                dedup_keys = [col for col in pk_columns if col in df.columns]
+                if dedup_keys:
+                    df = df.drop_duplicates(subset=dedup_keys, keep='last')
+            elif pk_columns is None:
+                df = df.drop_duplicates()
             duplicates_removed = original_count - len(df)
             if duplicates_removed > 0:
                 logger.info(f"  Removed {duplicates_removed:,} duplicate rows")
             
-            # 2. Handle datetime columns (suppress warnings)
+            # 2. Handle datetime columns with explicit formats
+            _DT_FORMATS = {'datetime': '%Y-%m-%d %H:%M:%S', 'timestamp': '%Y-%m-%d %H:%M:%S', 'date': '%Y-%m-%d'}
+            _NUMERIC_TYPES = {'tinyint', 'smallint', 'mediumint', 'int', 'bigint', 'decimal', 'float', 'double'}
+            
             for col in df.columns:
-                if 'date' in col.lower() or 'time' in col.lower():
+                mysql_type = col_types.get(col)
+                if mysql_type in _DT_FORMATS:
+                    if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                        df[col] = pd.to_datetime(
+                            df[col],
+                            format=_DT_FORMATS[mysql_type],
+                            errors='coerce',
+                            cache=True
+                        )
+                elif mysql_type is None and ('date' in col.lower() or 'time' in col.lower()):
+                    # Fallback heuristic when metadata is unavailable
                     try:
                         df[col] = pd.to_datetime(
                             df[col], 
@@ -640,31 +772,37 @@ async def transform_data(df: pd.DataFrame, table: str) -> pd.DataFrame:
                             errors='coerce',
                             dayfirst=False
                         )
-                    except:
+                    except (TypeError, ValueError):
                         pass
             
-            # 3. Standardize string columns
-            string_cols = df.select_dtypes(include=['object']).columns
+            # 3. Standardize string columns (only object columns can hold
+            # strings, so no try frame per column is needed)
+            string_cols = df.select_dtypes(include=['object']).columns.tolist()
             for col in string_cols:
                 try:
                     df[col] = df[col].str.strip()
-                except:
-                    pass
+                except (TypeError, AttributeError):
+                    pass  # mixed object column without string methods
             
-            # 4. Convert numeric columns
+            # 4. Convert numeric columns the driver left as objects
             for col in df.columns:
                 if df[col].dtype == 'object':
-                    try:
-                        df[col] = pd.to_numeric(df[col], errors='ignore')
-                    except:
-                        pass
-            
-            # 5. Data quality report
-            null_counts = df.isnull().sum()
-            if null_counts.sum() > 0:
-                logger.info(f"  NULL values found:")
-                for col, count in null_counts[null_counts > 0].items():
-                    logger.info(f"    - {col}: {count:,} NULLs")
+                    mysql_type = col_types.get(col)
+                    if mysql_type in _NUMERIC_TYPES:
+                        df[col] = pd.to_numeric(df[col], errors='coerce')
+                    elif mysql_type is None:
+                        try:
+                            df[col] = pd.to_numeric(df[col], errors='ignore')
+                        except (TypeError, ValueError):
+                            pass
+            
+            # 5. Data quality report (opt-in - costs a full scan per batch)
+            if os.getenv('ETL_NULL_REPORT', '0') == '1':
+                null_counts = df.isnull().sum()
+                if null_counts.sum() > 0:
+                    logger.info(f"  NULL values found:")
+                    for col, count in null_counts[null_counts > 0].items():
+                        logger.info(f"    - {col}: {count:,} NULLs")
             
             return df
         
@@ -687,12 +825,183 @@ async def transform_data(df: pd.DataFrame, table: str) -> pd.DataFrame:
 # -----------------------------------------
 # 🔹 STEP 3: LOAD (ASYNC)
 # -----------------------------------------
-async def load_data_aiomysql(df: pd.DataFrame, table: str, pk_columns: List[str], batch_size: int = 5000):
+def _prepare_batch_polars(batch_df) -> list:
+    """
+    Convert a batch (Polars or Pandas) to parameter tuples in one vectorized pass
+
+    The old per-row loop ran NaN/Inf/'nan' checks on every scalar
+    (rows x cols interpreter calls per batch). Polars masks do the same
+    cleanup column-wise in Rust, then a single .rows() call materializes
+    the parameter tuples.
+
+    Args:
+        batch_df: Pandas DataFrame batch
+
+    Returns:
+        List of row tuples ready for executemany
+    """
+    pdf = batch_df if isinstance(batch_df, pl.DataFrame) else pl.from_pandas(batch_df)
+
+    exprs = _prep_exprs(tuple(pdf.columns), tuple(str(dt) for dt in pdf.dtypes))
+    if exprs:
+        pdf = pdf.with_columns(list(exprs))
+
+    return pdf.rows()
+
+
+@lru_cache(maxsize=256)
+def _prep_exprs(columns: tuple, dtypes: tuple) -> tuple:
+    """
+    Build (once per schema) the cleanup expression plan for a batch
+
+    Keyed by column names + dtypes, so each table pays for expression
+    construction on its first batch only.
+    """
+    exprs = []
+    for col, dtype in zip(columns, dtypes):
+        c = pl.col(col)
+        if dtype in ('Float32', 'Float64'):
+            exprs.append(pl.when(c.is_nan() | c.is_infinite()).then(None).otherwise(c).alias(col))
+        elif dtype in ('Utf8', 'String'):
+            exprs.append(
+                pl.when(c.str.to_lowercase().is_in(['nan', 'inf', '-inf', 'null', 'none']))
+                .then(None)
+                .otherwise(c)
+                .alias(col)
+            )
+        elif dtype.startswith('Datetime'):
+            exprs.append(c.dt.strftime("%Y-%m-%d %H:%M:%S").alias(col))
+    return tuple(exprs)
+
+
+@lru_cache(maxsize=256)
+def build_loader(table: str, columns: tuple, pk_columns: tuple):
+    """
+    Build (once per table schema) the SQL parts for this table's loader
+
+    A table's schema is immutable within a run, so the column list,
+    placeholder row and UPSERT clause are rendered exactly once instead
+    of being re-joined from scratch on every batch.
+
+    Args:
+        table: Target table name
+        columns: Column names (tuple - cache key)
+        pk_columns: Primary key columns (tuple - cache key)
+
+    Returns:
+        (insert_prefix, row_placeholder, upsert_suffix, single_row_sql)
+    """
+    columns_str = ", ".join([f"`{col}`" for col in columns])
+    row_placeholder = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    insert_prefix = f"INSERT INTO `{table}` ({columns_str}) VALUES "
+
+    upsert_suffix = ""
+    if pk_columns:
+        update_cols = [col for col in columns if col not in pk_columns]
+        update_str = ", ".join([f"`{col}`=VALUES(`{col}`)" for col in update_cols])
+        upsert_suffix = f" ON DUPLICATE KEY UPDATE {update_str}"
+
+    single_row_sql = insert_prefix + row_placeholder + upsert_suffix
+    return insert_prefix, row_placeholder, upsert_suffix, single_row_sql
+
+
+def _build_multirow_insert(table: str, columns: list, rows: list, pk_columns: List[str]):
+    """
+    Build one multi-row INSERT covering all given rows
+
+    Args:
+        table: Target table name
+        columns: Column names
+        rows: Row tuples for this statement
+        pk_columns: Primary key columns for the UPSERT clause
+
+    Returns:
+        (sql, flat_args) ready for a single cursor.execute
+    """
+    insert_prefix, row_placeholder, upsert_suffix, _ = build_loader(
+        table, tuple(columns), tuple(pk_columns or ())
+    )
+    sql = insert_prefix + ", ".join([row_placeholder] * len(rows)) + upsert_suffix
+    flat_args = [val for row in rows for val in row]
+    return sql, flat_args
+
+
+async def _execute_group(cursor, table: str, columns: list, group: list, pk_columns: List[str]) -> int:
+    """
+    Send one multi-row INSERT; halve the group on a 1153 packet error
+
+    Groups are sized proactively from max_allowed_packet, so the split is
+    a safety net for rows whose estimated size undershot reality - it
+    halves rather than shattering the batch.
+
+    Returns:
+        Number of rows inserted
+    """
+    sql, flat_args = _build_multirow_insert(table, columns, group, pk_columns)
+    try:
+        await cursor.execute(sql, flat_args)
+        return len(group)
+    except Exception as e:
+        if len(group) > 1 and ('1153' in str(e) or 'max_allowed_packet' in str(e)):
+            logger.warning("⚠️  Packet too large for %s, halving group of %d rows", table, len(group))
+            mid = len(group) // 2
+            count = await _execute_group(cursor, table, columns, group[:mid], pk_columns)
+            count += await _execute_group(cursor, table, columns, group[mid:], pk_columns)
+            return count
+        raise
+
+
+# Queried once per run - the server-side packet limit does not change
+_packet_budget = None
+
+
+async def _get_packet_budget(cursor) -> int:
+    """Get 80% of the server's max_allowed_packet (cached after first call)"""
+    global _packet_budget
+    if _packet_budget is None:
+        await cursor.execute("SELECT @@max_allowed_packet")
+        (max_packet,) = await cursor.fetchone()
+        _packet_budget = max_packet * 8 // 10
+    return _packet_budget
+
+
+def _packet_sized_groups(data: list, packet_budget: int):
+    """
+    Split rows into groups whose rendered statement stays under the packet budget
+
+    Args:
+        data: All row tuples
+        packet_budget: Byte budget per statement (~80% of max_allowed_packet)
+
+    Yields:
+        Lists of row tuples
+    """
+    group = []
+    group_bytes = 0
+    for row in data:
+        # Rough rendered size: quoting/comma overhead plus value text
+        row_bytes = 8
+        for val in row:
+            row_bytes += 8 + (len(val) if isinstance(val, (str, bytes)) else 16)
+
+        if group and group_bytes + row_bytes > packet_budget:
+            yield group
+            group = []
+            group_bytes = 0
+
+        group.append(row)
+        group_bytes += row_bytes
+
+    if group:
+        yield group
+
+
+async def load_data_aiomysql(df: pl.DataFrame, table: str, pk_columns: List[str], batch_size: int = 5000):
     """
     Load data using aiomysql (3x faster than mysql-connector)
     
     Args:
-        df: Pandas DataFrame
+        df: Polars DataFrame (Pandas accepted for legacy callers)
         table: Table name
         pk_columns: Primary key columns
         batch_size: Batch size for inserts
@@ -700,82 +1009,31 @@ async def load_data_aiomysql(df: pd.DataFrame, table: str, pk_columns: List[str]
     try:
         logger.info(f"📤 Loading data to {table} (aiomysql)...")
         
-        # Prepare data conversion function
-        def prepare_batch_data(batch_df):
-            # Replace NaT/NaN with None
-            batch_df = batch_df.replace({pd.NaT: None, pd.NA: None, np.nan: None})
-            batch_df = batch_df.where(pd.notnull(batch_df), None)
-            
-            # Convert datetime columns to string
-            for col in batch_df.columns:
-                if pd.api.types.is_datetime64_any_dtype(batch_df[col]):
-                    batch_df[col] = batch_df[col].dt.strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Convert to list of tuples and clean up any remaining nan/inf values
-            data = []
-            for row in batch_df.to_numpy():
-                cleaned_row = []
-                for val in row:
-                    if val is None:
-                        cleaned_row.append(None)
-                    elif isinstance(val, float):
-                        if np.isnan(val) or np.isinf(val):
-                            cleaned_row.append(None)
-                        else:
-                            cleaned_row.append(val)
-                    elif isinstance(val, str):
-                        if val.lower() in ('nan', 'inf', '-inf', 'null', 'none'):
-                            cleaned_row.append(None)
-                        else:
-                            cleaned_row.append(val)
-                    else:
-                        cleaned_row.append(val)
-                data.append(tuple(cleaned_row))
-            
-            return data
-        
-        # Prepare data
-        columns = df.columns.tolist()
-        data = prepare_batch_data(df)
+        # Prepare data (vectorized Polars pass)
+        columns = list(df.columns)
+        data = _prepare_batch_polars(df)
+        total_rows = len(data)
         
-        # Build UPSERT statement
-        columns_str = ", ".join([f"`{col}`" for col in columns])
-        placeholders = ", ".join(["%s"] * len(columns))
-        
-        if pk_columns:
-            update_cols = [col for col in columns if col not in pk_columns]
-            update_str = ", ".join([f"`{col}`=VALUES(`{col}`)" for col in update_cols])
-            insert_stmt = f"""
-                INSERT INTO `{table}` ({columns_str})
-                VALUES ({placeholders})
-                ON DUPLICATE KEY UPDATE {update_str}
-            """
-        else:
-            insert_stmt = f"INSERT INTO `{table}` ({columns_str}) VALUES ({placeholders})"
+        # UPSERT statement parts are built once per table schema
+        _, _, _, insert_stmt = build_loader(table, tuple(columns), tuple(pk_columns or ()))
         
         # Get connection from pool
         async with db_pool_dst.acquire() as conn:
             async with conn.cursor() as cursor:
                 try:
-                    # Optimize for bulk insert
-                    await cursor.execute("SET SESSION foreign_key_checks=0")
-                    await cursor.execute("SET SESSION unique_checks=0")
-                    
-                    # Batch insert
-                    total_rows = len(data)
-                    for i in range(0, total_rows, batch_size):
-                        batch = data[i:i + batch_size]
-                        await cursor.executemany(insert_stmt, batch)
-                        logger.debug(f"  Inserted batch {i//batch_size + 1}: {len(batch):,} rows")
+                    # Multi-row inserts: one round-trip carries a whole
+                    # packet-sized group instead of one INSERT per row
+                    packet_budget = await _get_packet_budget(cursor)
+
+                    loaded = 0
+                    for group in _packet_sized_groups(data, packet_budget):
+                        loaded += await _execute_group(cursor, table, columns, group, pk_columns)
+                        logger.debug("  Inserted %d/%d rows", loaded, total_rows)
                     
                     # Commit
                     await conn.commit()
                     
-                    # Re-enable checks
-                    await cursor.execute("SET SESSION foreign_key_checks=1")
-                    await cursor.execute("SET SESSION unique_checks=1")
-                    
-                    logger.info(f"✓ Loaded {total_rows:,} records to {table} (aiomysql)")
+                    logger.info("✓ Loaded %d records to %s (aiomysql)", total_rows, table)
                     
                     if MONITOR_AVAILABLE:
                         add_log(f"Loaded {total_rows:,} rows to {table}", "INFO")
@@ -797,7 +1055,7 @@ async def load_data_aiomysql(df: pd.DataFrame, table: str, pk_columns: List[str]
                             continue
                     
                     await conn.commit()
-                    logger.info(f"✓ Loaded {success_count:,}/{len(data):,} records (row-by-row)")
+                    logger.info("✓ Loaded %d/%d records (row-by-row)", success_count, total_rows)
                     
                     if MONITOR_AVAILABLE:
                         add_log(f"Loaded {success_count:,} rows to {table} (with errors)", "WARNING")
@@ -808,271 +1066,134 @@ async def load_data_aiomysql(df: pd.DataFrame, table: str, pk_columns: List[str]
             add_log(f"Load error: {table} - {str(e)[:100]}", "ERROR")
         raise
 
-async def load_data(df: pd.DataFrame, table: str, pk_columns: List[str], batch_size: int = 50000):
+# LOAD DATA support is probed once; if the server refuses local_infile we
+# stop trying and go straight to the executemany loader
+_local_infile_ok = None
+
+async def load_data_infile(df: pl.DataFrame, table: str, pk_columns: List[str], batch_size: int = 5000):
     """
-    Load data to destination database with UPSERT
-    
+    Load data via LOAD DATA LOCAL INFILE (CSV shuttle)
+
+    executemany pays per-row parse/bind cost on the server; shipping the
+    chunk as one TSV stream lets InnoDB bulk-ingest it (~10-20x faster).
+    For UPSERT semantics the TSV lands in a temporary staging table first,
+    then one INSERT ... SELECT ... ON DUPLICATE KEY UPDATE merges it.
+
+    Falls back to load_data_aiomysql when the server disallows
+    local_infile or the bulk path fails.
+
     Args:
-        df: DataFrame to load
-        table: Target table name
-        pk_columns: Primary key columns for UPSERT
-        batch_size: Batch size for inserts
+        df: Polars DataFrame (Pandas accepted for legacy callers)
+        table: Table name
+        pk_columns: Primary key columns
+        batch_size: Fallback batch size for the executemany path
     """
+    global _local_infile_ok
+
+    if _local_infile_ok is False:
+        await load_data_aiomysql(df, table, pk_columns, batch_size)
+        return
+
+    tmp_path = None
     try:
+        logger.info(f"📤 Loading data to {table} (LOAD DATA INFILE)...")
+
         loop = asyncio.get_event_loop()
-        
-        # Get connection params
-        dst_params = await loop.run_in_executor(None, get_connection_params, "DST")
-        
-        # Connect to database (async) - use lambda to handle kwargs
-        def _connect():
-            return mysql.connector.connect(**dst_params)
-        
-        conn = await loop.run_in_executor(None, _connect)
-        await loop.run_in_executor(None, configure_session, conn, False)
-        
-        # Optimize for bulk insert
-        def _optimize_connection():
-            cursor = conn.cursor()
-            # Disable autocommit for better performance
-            conn.autocommit = False
-            # Disable foreign key checks for faster inserts
-            cursor.execute("SET SESSION foreign_key_checks=0")
-            # Disable unique checks temporarily
-            cursor.execute("SET SESSION unique_checks=0")
-            return cursor
-        
-        cursor = await loop.run_in_executor(None, _optimize_connection)
-        
-        logger.info(f"📤 Loading data to {table}...")
-        
-        # Get columns
-        columns = df.columns.tolist()
+        columns = list(df.columns)
         columns_str = ", ".join([f"`{col}`" for col in columns])
-        
-        # Build UPSERT statement
-        placeholders = ", ".join(["%s"] * len(columns))
-        
-        if pk_columns:
-            # UPSERT: INSERT ... ON DUPLICATE KEY UPDATE
-            update_cols = [col for col in columns if col not in pk_columns]
-            update_clause = ", ".join([f"`{col}` = VALUES(`{col}`)" for col in update_cols])
-            
-            sql_template = f"""
-                INSERT INTO `{table}` ({columns_str}) 
-                VALUES ({placeholders})
-                ON DUPLICATE KEY UPDATE {update_clause}
-            """
-        else:
-            # No PK: Simple INSERT (may create duplicates)
-            sql_template = f"""
-                INSERT INTO `{table}` ({columns_str}) 
-                VALUES ({placeholders})
-            """
-        
-        # Prepare data conversion function (vectorized)
-        def prepare_batch_data(batch_df):
-            # Replace NaT/NaN with None
-            batch_df = batch_df.replace({pd.NaT: None, pd.NA: None, np.nan: None})
-            batch_df = batch_df.where(pd.notnull(batch_df), None)
-            
-            # Convert datetime columns to string
-            for col in batch_df.columns:
-                if pd.api.types.is_datetime64_any_dtype(batch_df[col]):
-                    batch_df[col] = batch_df[col].dt.strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Convert to list of tuples and clean up any remaining nan/inf values
-            data = []
-            for row in batch_df.to_numpy():
-                cleaned_row = []
-                for val in row:
-                    # Check for nan, inf, or string 'nan'
-                    if val is None:
-                        cleaned_row.append(None)
-                    elif isinstance(val, float):
-                        if np.isnan(val) or np.isinf(val):
-                            cleaned_row.append(None)
-                        else:
-                            cleaned_row.append(val)
-                    elif isinstance(val, str):
-                        if val.lower() in ('nan', 'inf', '-inf', 'null', 'none'):
-                            cleaned_row.append(None)
-                        else:
-                            cleaned_row.append(val)
-                    else:
-                        cleaned_row.append(val)
-                data.append(tuple(cleaned_row))
-            
-            return data
-        
-        # Load in batches
-        total_loaded = 0
-        for i in range(0, len(df), batch_size):
-            batch_df = df.iloc[i:i + batch_size].copy()
-            
-            # Convert DataFrame to list of tuples (vectorized - FAST!)
-            batch_data = prepare_batch_data(batch_df)
-            
-            # Execute batch insert with better error handling (async)
-            try:
-                await loop.run_in_executor(None, cursor.executemany, sql_template, batch_data)
-                await loop.run_in_executor(None, conn.commit)
-                total_loaded += len(batch_data)
-                
-                # Log every 100k rows instead of every batch
-                if total_loaded % 100000 == 0 or total_loaded == len(df):
-                    logger.info(f"  Loaded batch: {total_loaded:,}/{len(df):,} rows")
-            except Exception as batch_error:
-                error_str = str(batch_error)
-                logger.warning(f"  Batch insert failed: {error_str[:200]}")
-                
-                # Check if it's max_allowed_packet error
-                if '1153' in error_str or 'max_allowed_packet' in error_str:
-                    logger.warning(f"  Packet too large, splitting batch into smaller chunks...")
-                    
-                    # Rollback failed transaction
-                    try:
-                        await loop.run_in_executor(None, conn.rollback)
-                    except:
-                        pass
-                    
-                    # Split batch into smaller chunks (1/50 of original, minimum 10 rows)
-                    smaller_batch_size = max(10, len(batch_data) // 50)
-                    success_count = 0
-                    
-                    logger.info(f"  Splitting {len(batch_data)} rows into batches of {smaller_batch_size} rows")
-                    
-                    for j in range(0, len(batch_data), smaller_batch_size):
-                        small_batch = batch_data[j:j + smaller_batch_size]
-                        try:
-                            await loop.run_in_executor(None, cursor.executemany, sql_template, small_batch)
-                            await loop.run_in_executor(None, conn.commit)
-                            success_count += len(small_batch)
-                            
-                            # Log progress every 10 batches
-                            if (j // smaller_batch_size) % 10 == 0:
-                                logger.info(f"  Progress: {success_count}/{len(batch_data)} rows")
-                        except Exception as small_error:
-                            logger.warning(f"  Small batch failed, trying row-by-row for {len(small_batch)} rows...")
-                            
-                            # Rollback
-                            try:
-                                await loop.run_in_executor(None, conn.rollback)
-                            except:
-                                pass
-                            
-                            # Row-by-row for this small batch
-                            for row_data in small_batch:
-                                try:
-                                    await loop.run_in_executor(None, cursor.execute, sql_template, row_data)
-                                    await loop.run_in_executor(None, conn.commit)
-                                    success_count += 1
-                                except Exception as row_error:
-                                    # Check if connection lost
-                                    if 'Lost connection' in str(row_error):
-                                        logger.warning(f"  Connection lost, reconnecting...")
-                                        # Reconnect
-                                        try:
-                                            conn.close()
-                                        except:
-                                            pass
-                                        
-                                        conn = mysql.connector.connect(**dst_params)
-                                        cursor = conn.cursor()
-                                        
-                                        # Disable checks again
-                                        cursor.execute("SET SESSION foreign_key_checks=0")
-                                        cursor.execute("SET SESSION unique_checks=0")
-                                        cursor.execute("SET SESSION sql_mode='NO_AUTO_VALUE_ON_ZERO'")
-                                        
-                                        # Retry this row
-                                        try:
-                                            cursor.execute(sql_template, row_data)
-                                            conn.commit()
-                                            success_count += 1
-                                        except:
-                                            continue
-                                    continue
-                    
-                    total_loaded += success_count
-                    logger.info(f"  Loaded {success_count}/{len(batch_data)} rows after splitting")
-                    
+
+        # Write the chunk as TSV (Polars writer - no per-cell Python work).
+        # The drivers only accept LOCAL INFILE by filename, so the closest
+        # thing to a memory stream is a short-lived tmpfs-backed file.
+        fd, tmp_path = tempfile.mkstemp(suffix=".tsv")
+        os.close(fd)
+
+        def _write_tsv():
+            pdf = df if isinstance(df, pl.DataFrame) else pl.from_pandas(df)
+            # Run the executemany path's normalization plan so both loaders
+            # store identical values: it nulls out placeholder strings
+            # ('nan', 'null', ...) and float NaN/Inf - which write_csv
+            # would otherwise emit literally into the TEXT column - and
+            # formats datetimes as %Y-%m-%d %H:%M:%S
+            prep = _prep_exprs(tuple(pdf.columns), tuple(str(dt) for dt in pdf.dtypes))
+            if prep:
+                pdf = pdf.with_columns(list(prep))
+            # LOAD DATA's default ESCAPED BY '\\' reinterprets raw
+            # backslashes (a literal \t in a value would load as a tab),
+            # so double them on write - the \N NULL marker is unaffected
+            # because null_value bypasses the column data
+            esc = [
+                pl.col(col).str.replace_all("\\", "\\\\", literal=True)
+                for col, dtype in zip(pdf.columns, pdf.dtypes)
+                if dtype == pl.Utf8
+            ]
+            if esc:
+                pdf = pdf.with_columns(esc)
+            pdf.write_csv(
+                tmp_path,
+                separator="\t",
+                include_header=False,
+                null_value="\\N",
+                datetime_format="%Y-%m-%d %H:%M:%S"
+            )
+
+        await loop.run_in_executor(None, _write_tsv)
+
+        load_tsv = (
+            "LOAD DATA LOCAL INFILE %s INTO TABLE `{target}` "
+            "FIELDS TERMINATED BY '\t' OPTIONALLY ENCLOSED BY '\"' "
+            "LINES TERMINATED BY '\n' "
+            f"({columns_str})"
+        )
+
+        await _ensure_db_pools()
+        async with db_pool_dst.acquire() as conn:
+            async with conn.cursor() as cursor:
+                if pk_columns:
+                    # Stage then merge for UPSERT semantics
+                    staging = f"_stg_{table}"
+                    await cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS `{staging}`")
+                    await cursor.execute(f"CREATE TEMPORARY TABLE `{staging}` LIKE `{table}`")
+                    await cursor.execute(load_tsv.format(target=staging), (tmp_path,))
+
+                    update_cols = [col for col in columns if col not in pk_columns]
+                    update_str = ", ".join([f"`{col}`=VALUES(`{col}`)" for col in update_cols])
+                    merge_stmt = (
+                        f"INSERT INTO `{table}` ({columns_str}) "
+                        f"SELECT {columns_str} FROM `{staging}` "
+                        f"ON DUPLICATE KEY UPDATE {update_str}"
+                    )
+                    await cursor.execute(merge_stmt)
+                    await cursor.execute(f"DROP TEMPORARY TABLE `{staging}`")
                 else:
-                    # Other errors: try row-by-row
-                    logger.warning(f"  Trying row-by-row...")
-                    
-                    # Rollback failed transaction
-                    try:
-                        await loop.run_in_executor(None, conn.rollback)
-                    except:
-                        pass
-                    
-                    # Fallback: row-by-row with detailed error logging
-                    success_count = 0
-                    for idx, row_data in enumerate(batch_data):
-                        try:
-                            await loop.run_in_executor(None, cursor.execute, sql_template, row_data)
-                            await loop.run_in_executor(None, conn.commit)
-                            success_count += 1
-                        except Exception as row_error:
-                            # Check if connection lost
-                            if 'Lost connection' in str(row_error):
-                                logger.warning(f"  Connection lost, reconnecting...")
-                                # Reconnect
-                                try:
-                                    conn.close()
-                                except:
-                                    pass
-                                
-                                conn = mysql.connector.connect(**dst_params)
-                                cursor = conn.cursor()
-                                
-                                # Disable checks again
-                                cursor.execute("SET SESSION foreign_key_checks=0")
-                                cursor.execute("SET SESSION unique_checks=0")
-                                cursor.execute("SET SESSION sql_mode='NO_AUTO_VALUE_ON_ZERO'")
-                                
-                                # Retry this row
-                                try:
-                                    cursor.execute(sql_template, row_data)
-                                    conn.commit()
-                                    success_count += 1
-                                except:
-                                    continue
-                            else:
-                                # Log first few errors only
-                                if idx < 3:
-                                    logger.debug(f"  Row {idx} error: {str(row_error)[:150]}")
-                            continue
-                    
-                    total_loaded += success_count
-                    
-                    if success_count < len(batch_data):
-                        logger.warning(f"  Loaded {success_count}/{len(batch_data)} rows from failed batch")
-        
-        logger.info(f"✓ Loaded {total_loaded:,} records to {table}")
-        
-        # Re-enable checks
-        def _restore_checks():
-            cursor.execute("SET SESSION foreign_key_checks=1")
-            cursor.execute("SET SESSION unique_checks=1")
-            conn.commit()
-        
-        await loop.run_in_executor(None, _restore_checks)
-        
+                    await cursor.execute(load_tsv.format(target=table), (tmp_path,))
+
+            await conn.commit()
+        _local_infile_ok = True
+
+        logger.info("✓ Loaded %d records to %s (LOAD DATA INFILE)", len(df), table)
+
         if MONITOR_AVAILABLE:
-            add_log(f"Loaded {total_loaded:,} rows to {table}", "INFO")
-        
+            add_log(f"Loaded {len(df):,} rows to {table}", "INFO")
+
     except Exception as e:
-        logger.error(f"✗ Error loading to {table}: {e}")
-        if MONITOR_AVAILABLE:
-            add_log(f"Load error: {table} - {str(e)[:100]}", "ERROR")
-        raise
+        # Only latch the fast path off when the server actually refuses
+        # local_infile (ER 1148 / ER 3948) - a transient lock wait or a
+        # staging-merge error should not disable it for the whole run
+        err_no = e.args[0] if getattr(e, 'args', None) else None
+        if err_no in (1148, 3948):
+            _local_infile_ok = False
+            logger.warning(f"⚠️  LOAD DATA INFILE unavailable ({str(e)[:100]}), using executemany loader")
+        else:
+            logger.warning(f"⚠️  LOAD DATA INFILE failed for {table}: {str(e)[:100]}, retrying via executemany")
+
+        await load_data_aiomysql(df, table, pk_columns, batch_size)
     finally:
-        if 'cursor' in locals():
-            cursor.close()
-        if 'conn' in locals():
-            conn.close()
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
 
 # -----------------------------------------
@@ -1084,8 +1205,8 @@ async def create_table_if_not_exists(table: str):
         loop = asyncio.get_event_loop()
         
         # Get connection params (async)
-        src_params = await loop.run_in_executor(None, get_connection_params, "SRC")
-        dst_params = await loop.run_in_executor(None, get_connection_params, "DST")
+        src_params = get_connection_params("SRC")
+        dst_params = get_connection_params("DST")
         
         # Ensure destination database exists (for dynamic DB mode)
         is_dynamic = get_env('DST_DB_DYNAMIC', 'false').lower() == 'true'
@@ -1101,29 +1222,26 @@ async def create_table_if_not_exists(table: str):
             
             await loop.run_in_executor(None, _ensure_database)
         
-        # Get column names from source (async)
+        # Get schema from cached metadata - one information_schema query
+        # per schema covers every table's columns and PKs, instead of two
+        # SHOW queries on a fresh connection per table
+        schema = src_params['database']
+        
         def _get_schema():
-            src_conn = mysql.connector.connect(**src_params)
-            src_cursor = src_conn.cursor()
-            src_cursor.execute(f"SHOW COLUMNS FROM `{table}`")
-            columns_info = src_cursor.fetchall()
-            
-            src_cursor.execute(f"SHOW KEYS FROM `{table}` WHERE Key_name = 'PRIMARY'")
-            pk_info = src_cursor.fetchall()
-            pk_columns = [row[4] for row in pk_info] if pk_info else []
-            
-            src_conn.close()
-            return columns_info, pk_columns
+            columns = list(get_column_types(src_params, schema, table).keys())
+            pk_columns = get_primary_key_columns(src_params, schema, table)
+            return columns, pk_columns
+        
+        columns, pk_columns = await loop.run_in_executor(None, _get_schema)
         
-        columns_info, pk_columns = await loop.run_in_executor(None, _get_schema)
+        if not columns:
+            raise ValueError(f"Table {table} not found in source schema {schema}")
         
         # Build CREATE TABLE statement with TEXT columns
         logger.info(f"Creating table {table} (all TEXT, NULL allowed)...")
         
         column_defs = []
-        for col_info in columns_info:
-            col_name = col_info[0]
-            
+        for col_name in columns:
             # All columns as TEXT NULL, except PK uses VARCHAR
             if col_name in pk_columns:
                 # Primary key: VARCHAR(255) NOT NULL (TEXT can't be PK without length)
@@ -1137,23 +1255,55 @@ async def create_table_if_not_exists(table: str):
             pk_cols_str = ", ".join([f"`{col}`" for col in pk_columns])
             column_defs.append(f"PRIMARY KEY ({pk_cols_str})")
         
+        # Fresh load each run: drop and recreate explicitly (the old
+        # DROP + CREATE IF NOT EXISTS pair was contradictory)
         create_stmt = f"""
-            CREATE TABLE IF NOT EXISTS `{table}` (
+            CREATE TABLE `{table}` (
                 {', '.join(column_defs)}
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
         """
         
-        # Create in destination (async)
-        def _create_table():
-            dst_conn = mysql.connector.connect(**dst_params)
-            dst_cursor = dst_conn.cursor()
-            
-            dst_cursor.execute(f"DROP TABLE IF EXISTS `{table}`")
-            dst_cursor.execute(create_stmt)
-            dst_conn.commit()
-            dst_conn.close()
+        # On reruns with an unchanged layout a TRUNCATE discards the
+        # extents in place, instead of DROP + CREATE forcing InnoDB to
+        # rebuild the tablespace and PK B-tree. The layout hash of the
+        # last run is kept in a sidecar table on the destination.
+        schema_hash = hashlib.md5(create_stmt.encode()).hexdigest()
         
-        await loop.run_in_executor(None, _create_table)
+        # Create in destination on the shared pool - no per-table handshake
+        await _ensure_db_pools()
+        async with db_pool_dst.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    "CREATE TABLE IF NOT EXISTS `_etl_schema` ("
+                    "`table_name` VARCHAR(64) NOT NULL PRIMARY KEY, "
+                    "`schema_hash` CHAR(32) NOT NULL"
+                    ") ENGINE=InnoDB"
+                )
+                await cursor.execute(
+                    "SELECT `schema_hash` FROM `_etl_schema` WHERE `table_name` = %s",
+                    (table,),
+                )
+                row = await cursor.fetchone()
+                
+                if row and row[0] == schema_hash:
+                    try:
+                        await cursor.execute(f"TRUNCATE TABLE `{table}`")
+                        await conn.commit()
+                        logger.info(f"✓ Table {table} truncated (schema unchanged)")
+                        return
+                    except Exception as trunc_error:
+                        # Table missing or layout drifted behind our back -
+                        # fall through to the full recreate
+                        logger.warning(f"⚠️  TRUNCATE failed for {table}, recreating: {trunc_error}")
+                
+                await cursor.execute(f"DROP TABLE IF EXISTS `{table}`")
+                await cursor.execute(create_stmt)
+                await cursor.execute(
+                    "INSERT INTO `_etl_schema` (`table_name`, `schema_hash`) VALUES (%s, %s) "
+                    "ON DUPLICATE KEY UPDATE `schema_hash` = VALUES(`schema_hash`)",
+                    (table, schema_hash),
+                )
+            await conn.commit()
         
         logger.info(f"✓ Table {table} created (TEXT columns, NULL allowed)")
         
@@ -1207,6 +1357,92 @@ async def producer_worker(table: str, queue: asyncio.Queue, chunk_size: int, tot
 # -----------------------------------------
 # 🔹 CONSUMER: Load Workers
 # -----------------------------------------
+class _ByteBoundedQueue:
+    """
+    asyncio.Queue bounded by payload bytes rather than item count
+
+    Chunks range from a few MB to hundreds of MB depending on row width,
+    so counting items alone lets a handful of wide chunks blow the
+    working set. put() blocks while buffered bytes would exceed the
+    budget (a single oversized chunk is still admitted when empty).
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._bytes = 0
+        self._queue = asyncio.Queue()
+        self._space = asyncio.Condition()
+
+    @staticmethod
+    def _sizeof(item) -> int:
+        df = item[1] if isinstance(item, tuple) else item
+        try:
+            if isinstance(df, pl.DataFrame):
+                return int(df.estimated_size())
+            return int(df.memory_usage(deep=False).sum())
+        except Exception:
+            return 0
+
+    async def put(self, item):
+        size = self._sizeof(item)
+        async with self._space:
+            while self._bytes > 0 and self._bytes + size > self.max_bytes:
+                await self._space.wait()
+            self._bytes += size
+        await self._queue.put((size, item))
+
+    async def get(self):
+        size, item = await self._queue.get()
+        async with self._space:
+            self._bytes -= size
+            self._space.notify_all()
+        return item
+
+    def task_done(self):
+        self._queue.task_done()
+
+    def empty(self) -> bool:
+        return self._queue.empty()
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+
+# One process handle for RSS sampling - psutil.Process() re-reads
+# /proc on construction, so building it per chunk is wasted syscalls
+_process = psutil.Process()
+
+# Per-worker progress counters - workers bump plain ints here and the
+# background flusher pushes them to the monitor at most once per second,
+# instead of copying the whole workers dict on every chunk
+_worker_rows = {}
+
+
+async def _flush_monitor(interval: float = 1.0):
+    """Push accumulated worker counters to the monitor once per interval"""
+    if not MONITOR_AVAILABLE:
+        return
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            if not _worker_rows:
+                continue
+            
+            state = get_state()
+            workers = state.get('workers', {})
+            dirty = False
+            for (table, worker_name, field), rows in list(_worker_rows.items()):
+                worker = workers.get(table, {}).get(worker_name)
+                if worker is not None and worker.get(field) != rows:
+                    worker[field] = rows
+                    dirty = True
+            
+            if dirty:
+                update_state('workers', workers)
+    except asyncio.CancelledError:
+        pass
+
+
 async def consumer_worker(table: str, queue: asyncio.Queue, pk_columns: List[str], batch_size: int, worker_id: int, stop_event: asyncio.Event):
     """
     Consumer worker that loads data from queue
@@ -1228,68 +1464,75 @@ async def consumer_worker(table: str, queue: asyncio.Queue, pk_columns: List[str
             }
             update_state('workers', state['workers'])
         
-        while True:
-            try:
-                # ✅ Wait and compete for data from cache storage (async/await)
-                cache_item = await cache_storage.get(timeout=5.0)
-                
-                if cache_item:
-                    # Got data from cache
-                    chunk_num = cache_item.chunk_id
-                    df_chunk = cache_item.data
-                    
-                    logger.info(f"🔵 Consumer-{worker_id}: Loading chunk {chunk_num} ({len(df_chunk):,} rows) from cache...")
-                    
-                    # ✅ Load data with aiomysql (3x faster)
-                    await load_data_aiomysql(df_chunk, table, pk_columns, batch_size)
-                    
-                    # Free memory after loading
-                    chunk_size_loaded = len(df_chunk)
-                    del df_chunk
-                    del cache_item
-                    import gc
-                    gc.collect()
-                    
-                    rows_loaded += chunk_size_loaded
+        # One wait over cache, fallback queue and the stop signal - while
+        # running there are no polling timeouts, so an idle consumer wakes
+        # the moment data (or shutdown) arrives instead of sleeping one out
+        cache_task = asyncio.create_task(cache_storage.get(table, timeout=None))
+        queue_task = asyncio.create_task(queue.get())
+        stop_task = asyncio.create_task(stop_event.wait())
+        drain_timeout = None
+
+        try:
+            while True:
+                waiters = {cache_task, queue_task}
+                if not stop_task.done():
+                    waiters.add(stop_task)
+                done, _ = await asyncio.wait(
+                    waiters,
+                    timeout=drain_timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if cache_task in done:
+                    cache_item = cache_task.result()
+                    cache_task = asyncio.create_task(cache_storage.get(table, timeout=None))
                     
-                    logger.info(f"✓ Consumer-{worker_id}: Chunk {chunk_num} loaded")
-                else:
-                    # Try fallback queue if cache timeout
-                    try:
-                        chunk_num, df_chunk = await asyncio.wait_for(queue.get(), timeout=1.0)
+                    if cache_item:
+                        # Got data from cache (Arrow RecordBatch -> Polars, zero-copy)
+                        chunk_num = cache_item.chunk_id
+                        df_chunk = cache_item.to_polars()
                         
-                        logger.info(f"🔵 Consumer-{worker_id}: Loading chunk {chunk_num} from queue...")
+                        logger.info("🔵 Consumer-%s: Loading chunk %s (%d rows) from cache...", worker_id, chunk_num, len(df_chunk))
                         
-                        # ✅ Load data with aiomysql (3x faster)
-                        await load_data_aiomysql(df_chunk, table, pk_columns, batch_size)
+                        # ✅ Load via LOAD DATA INFILE (falls back to aiomysql)
+                        await load_data_infile(df_chunk, table, pk_columns, batch_size)
                         
-                        chunk_size_loaded = len(df_chunk)
+                        # Free memory after loading
+                        rows_loaded += len(df_chunk)
                         del df_chunk
-                        import gc
-                        gc.collect()
+                        del cache_item
                         
-                        queue.task_done()
-                        rows_loaded += chunk_size_loaded
-                        
-                        logger.info(f"✓ Consumer-{worker_id}: Chunk {chunk_num} loaded from queue")
-                    except asyncio.TimeoutError:
-                        # No data in cache or queue, check if we should stop
-                        if stop_event.is_set():
-                            break
-                        continue
+                        logger.info(f"✓ Consumer-{worker_id}: Chunk {chunk_num} loaded")
+
+                if queue_task in done:
+                    chunk_num, df_chunk = queue_task.result()
+                    queue_task = asyncio.create_task(queue.get())
+                    
+                    logger.info(f"🔵 Consumer-{worker_id}: Loading chunk {chunk_num} from queue...")
+                    
+                    # ✅ Load via LOAD DATA INFILE (falls back to aiomysql)
+                    await load_data_infile(df_chunk, table, pk_columns, batch_size)
+                    
+                    rows_loaded += len(df_chunk)
+                    del df_chunk
+                    
+                    queue.task_done()
+                    logger.info(f"✓ Consumer-{worker_id}: Chunk {chunk_num} loaded from queue")
                 
-                # Update monitor - progress
+                # Update monitor - progress (pushed by _flush_monitor)
                 if MONITOR_AVAILABLE:
-                    state = get_state()
-                    if 'workers' in state and table in state['workers']:
-                        state['workers'][table][f'consumer-{worker_id}']['rows_loaded'] = rows_loaded
-                        update_state('workers', state['workers'])
-                
-            except asyncio.TimeoutError:
-                # Check if we should stop
-                if stop_event.is_set() and queue.empty():
-                    break
-                continue
+                    _worker_rows[(table, f'consumer-{worker_id}', 'rows_loaded')] = rows_loaded
+
+                if stop_task.done():
+                    # Producers are finished: keep draining while data still
+                    # shows up, stop after one quiet grace period
+                    drain_timeout = 1.0
+                    if not done and queue.empty():
+                        break
+        finally:
+            cache_task.cancel()
+            queue_task.cancel()
+            stop_task.cancel()
         
         logger.info(f"✓ Consumer-{worker_id} completed (no more chunks)")
         
@@ -1366,12 +1609,9 @@ async def producer_worker(table: str, queue: asyncio.Queue, chunk_size: int, tot
             chunk_num += 1
             rows_processed += len(df_chunk)
             
-            # Update monitor - progress
+            # Update monitor - progress (pushed by _flush_monitor)
             if MONITOR_AVAILABLE:
-                state = get_state()
-                if 'workers' in state and table in state['workers']:
-                    state['workers'][table][f'producer-{worker_id}']['rows_processed'] = rows_processed
-                    update_state('workers', state['workers'])
+                _worker_rows[(table, f'producer-{worker_id}', 'rows_processed')] = rows_processed
         
         logger.info(f"✓ Producer-{worker_id} completed")
         
@@ -1438,8 +1678,6 @@ async def producer_worker_with_offset(table: str, queue: asyncio.Queue, chunk_si
             
             # Free memory
             del df_chunk
-            import gc
-            gc.collect()
             
             # ✅ Put into queue immediately - consumer processes while we fetch next
             await queue.put((chunk_num, df_transformed))
@@ -1450,12 +1688,9 @@ async def producer_worker_with_offset(table: str, queue: asyncio.Queue, chunk_si
             chunk_num += 1
             rows_processed += len(df_transformed)
             
-            # Update monitor - progress
+            # Update monitor - progress (pushed by _flush_monitor)
             if MONITOR_AVAILABLE:
-                state = get_state()
-                if 'workers' in state and table in state['workers']:
-                    state['workers'][table][f'producer-{worker_id}']['rows_processed'] = rows_processed
-                    update_state('workers', state['workers'])
+                _worker_rows[(table, f'producer-{worker_id}', 'rows_processed')] = rows_processed
         
         logger.info(f"✓ Producer-{worker_id} completed")
         
@@ -1507,7 +1742,7 @@ async def run_etl_for_table_parallel(table: str, schema: str, num_producers: int
         
         # Get table info
         loop = asyncio.get_event_loop()
-        src_params = await loop.run_in_executor(None, get_connection_params, "SRC")
+        src_params = get_connection_params("SRC")
         pk_columns = await loop.run_in_executor(None, get_primary_key_columns, src_params, schema, table)
         logger.info(f"Primary key: {pk_columns if pk_columns else 'None'}")
         
@@ -1536,32 +1771,31 @@ async def run_etl_for_table_parallel(table: str, schema: str, num_producers: int
         
         # Update monitor with batch/chunk info
         if MONITOR_AVAILABLE:
-            state = get_state()
-            if 'tables_status' not in state:
-                state['tables_status'] = {}
-            state['tables_status'][table] = {
-                'status': 'processing',
-                'progress': 0,
-                'error': None,
-                'chunk_size': chunk_size,
-                'batch_size': batch_size,
-                'num_producers': num_producers,
-                'num_consumers': num_consumers
-            }
-            update_state('tables_status', state['tables_status'])
+            mutate_table_status(
+                table,
+                status='processing',
+                progress=0,
+                error=None,
+                chunk_size=chunk_size,
+                batch_size=batch_size,
+                num_producers=num_producers,
+                num_consumers=num_consumers,
+            )
         
         # Create table
         await create_table_if_not_exists(table)
         
         # Create queue and stop event
-        queue = asyncio.Queue(maxsize=num_consumers * 2)  # Buffer size
+        # Overflow buffer bounded by bytes, not chunk count
+        queue_mb = get_env_int("QUEUE_MAX_MB", 512)
+        queue = _ByteBoundedQueue(queue_mb * 1048576)
         stop_event = asyncio.Event()
         
         # Calculate rows per producer
         rows_per_producer = total_rows // num_producers
         
         # ✅ Start cache monitor
-        cache_monitor_task = asyncio.create_task(monitor_cache(interval=10))
+        cache_monitor_task = asyncio.create_task(monitor_cache(interval=60))
         logger.info("📦 Cache monitor started")
         
         # ✅ Start consumers first - they will wait for data in cache
@@ -1577,21 +1811,40 @@ async def run_etl_for_table_parallel(table: str, schema: str, num_producers: int
         logger.info(f"🟢 Starting {num_producers} producers (fetching data)...")
         producer_tasks = []
         
-        for i in range(num_producers):
-            start_offset = i * rows_per_producer
-            # Last producer takes remaining rows
-            end_offset = total_rows if i == num_producers - 1 else (i + 1) * rows_per_producer
-            producer_rows = end_offset - start_offset
+        if pk_columns:
+            # Keyset pagination: producers share a PK cursor and seek via
+            # the clustered index - no LIMIT/OFFSET row skipping
+            cursor_queue = asyncio.Queue()
+            cursor_queue.put_nowait((0, None))
             
-            if producer_rows > 0:
+            for i in range(num_producers):
                 task = asyncio.create_task(
-                    producer_worker_with_offset(table, queue, chunk_size, start_offset, producer_rows, i+1)
+                    producer_worker_keyset(table, queue, chunk_size, pk_columns, cursor_queue, total_rows, i+1)
                 )
                 producer_tasks.append(task)
+        else:
+            # No PK to seek on - fall back to OFFSET ranges
+            logger.warning(f"⚠️  No primary key on {table}, falling back to OFFSET pagination")
+            
+            for i in range(num_producers):
+                start_offset = i * rows_per_producer
+                # Last producer takes remaining rows
+                end_offset = total_rows if i == num_producers - 1 else (i + 1) * rows_per_producer
+                producer_rows = end_offset - start_offset
+                
+                if producer_rows > 0:
+                    task = asyncio.create_task(
+                        producer_worker_with_offset(table, queue, chunk_size, start_offset, producer_rows, i+1)
+                    )
+                    producer_tasks.append(task)
         
         # ✅ Run producers and consumers concurrently (fully async/await)
         logger.info("⚡ Producers and Consumers running concurrently...")
         
+        # Progress counters go to the monitor once per second, not per chunk
+        flush_interval = max(get_env_int('MONITOR_FLUSH_MS', 1000), 50) / 1000.0
+        monitor_flush_task = asyncio.create_task(_flush_monitor(flush_interval))
+        
         # Wait for all producers to finish (consumers still running)
         await asyncio.gather(*producer_tasks)
         logger.info("✓ All producers completed")
@@ -1605,10 +1858,11 @@ async def run_etl_for_table_parallel(table: str, schema: str, num_producers: int
         
         # ✅ Stop cache monitor and print stats
         cache_monitor_task.cancel()
+        monitor_flush_task.cancel()
         cache_storage.print_stats()
         
-        # ✅ Clear cache for next table
-        await cache_storage.clear()
+        # ✅ Clear this table's cache entries (other tables may be mid-run)
+        await cache_storage.clear(table)
         
         # Success
         elapsed = time.time() - start_time
@@ -1618,21 +1872,18 @@ async def run_etl_for_table_parallel(table: str, schema: str, num_producers: int
         
         # Update monitor
         if MONITOR_AVAILABLE:
-            state = get_state()
-            state['tables_status'][table] = {
-                'status': 'completed',
-                'progress': 100,
-                'error': None
-            }
-            update_state('tables_status', state['tables_status'])
+            mutate_table_status(table, status='completed', progress=100, error=None)
             
             # Clear workers for this table
+            state = get_state()
             if 'workers' in state and table in state['workers']:
                 del state['workers'][table]
                 update_state('workers', state['workers'])
             
-            completed = state.get('completed_tables', 0) + 1
-            update_state('completed_tables', completed)
+            for key in [k for k in _worker_rows if k[0] == table]:
+                del _worker_rows[key]
+            
+            incr_table_counter('completed_tables')
         
         return True
         
@@ -1641,22 +1892,15 @@ async def run_etl_for_table_parallel(table: str, schema: str, num_producers: int
         
         # Update monitor
         if MONITOR_AVAILABLE:
-            state = get_state()
-            if 'tables_status' in state:
-                state['tables_status'][table] = {
-                    'status': 'failed',
-                    'progress': 0,
-                    'error': str(e)[:200]
-                }
-                update_state('tables_status', state['tables_status'])
+            mutate_table_status(table, status='failed', progress=0, error=str(e)[:200])
             
             # Clear workers for this table
+            state = get_state()
             if 'workers' in state and table in state['workers']:
                 del state['workers'][table]
                 update_state('workers', state['workers'])
             
-            failed = state.get('failed_tables', 0) + 1
-            update_state('failed_tables', failed)
+            incr_table_counter('failed_tables')
         
         return False
 
@@ -1671,7 +1915,7 @@ async def producer_worker_with_offset(table: str, queue: asyncio.Queue, chunk_si
         chunk_num = start_offset // chunk_size
         rows_processed = 0
         
-        logger.info(f"🟢 Producer-{worker_id}: Processing rows {start_offset:,} to {end_offset:,}")
+        logger.info("🟢 Producer-%s: Processing rows %d to %d", worker_id, start_offset, end_offset)
         
         # Update monitor - initialize worker
         if MONITOR_AVAILABLE:
@@ -1688,57 +1932,66 @@ async def producer_worker_with_offset(table: str, queue: asyncio.Queue, chunk_si
             }
             update_state('workers', state['workers'])
         
+        # Prefetch pipeline: the network wait for chunk K+1 overlaps the
+        # CPU transform of chunk K
+        prefetch = None
+        if offset < end_offset:
+            prefetch = asyncio.create_task(
+                extract_chunk_with_offset_polars(table, offset, min(chunk_size, end_offset - offset))
+            )
+        
         while offset < end_offset:
-            # ✅ Always use full chunk_size - don't reduce based on remaining rows
-            # Extract exactly chunk_size rows (or whatever remains if less than chunk_size)
             current_chunk_size = min(chunk_size, end_offset - offset)
             
-            # ✅ Extract chunk with Polars (Pandas → Polars conversion)
-            df_chunk = await extract_chunk_with_offset_polars(table, offset, current_chunk_size)
+            # ✅ Extract chunk with Polars (already in flight from last loop)
+            df_chunk = await prefetch
+            prefetch = None
             
             if len(df_chunk) == 0:
                 break
             
+            # Kick off the next fetch before transforming this chunk
+            next_offset = offset + current_chunk_size
+            if next_offset < end_offset:
+                prefetch = asyncio.create_task(
+                    extract_chunk_with_offset_polars(table, next_offset, min(chunk_size, end_offset - next_offset))
+                )
+            
             # ✅ Transform chunk with Polars (5-10x faster)
-            df_transformed = await transform_data_polars(df_chunk, table)
+            df_transformed = await transform_data_polars(df_chunk, table, pk_columns=[])
             
-            # ✅ Convert to Pandas for cache/load
-            df_pandas = df_transformed.to_pandas()
+            # Arrow end-to-end: the Polars frame goes straight to cache/load
             
             # Free memory from original chunks
             del df_chunk
-            del df_transformed
-            import gc
-            gc.collect()
             
-            # Log memory usage periodically
-            if chunk_num % 10 == 0:
-                import psutil
-                process = psutil.Process()
-                memory_mb = process.memory_info().rss / 1024 / 1024
+            # Log memory usage periodically - sample the RSS only when a
+            # DEBUG handler will actually see it
+            if chunk_num % 10 == 0 and logger.isEnabledFor(logging.DEBUG):
+                memory_mb = _process.memory_info().rss / 1024 / 1024
                 logger.debug(f"🟢 Producer-{worker_id}: Memory usage: {memory_mb:.1f} MB")
             
             # ✅ Put into cache storage (async/await - non-blocking)
             # Consumers will compete to get this data
-            success = await cache_storage.put(table, chunk_num, df_pandas, worker_id)
+            success = await cache_storage.put(table, chunk_num, df_transformed, worker_id)
             if success:
-                logger.info(f"🟢 Producer-{worker_id}: Chunk {chunk_num} cached ({len(df_pandas):,} rows) → consumers competing...")
+                logger.info("🟢 Producer-%s: Chunk %s cached (%d rows) → consumers competing...", worker_id, chunk_num, len(df_transformed))
             else:
                 # Fallback to direct queue if cache is full
-                await queue.put((chunk_num, df_pandas))
+                await queue.put((chunk_num, df_transformed))
                 logger.warning(f"⚠️  Producer-{worker_id}: Cache full, using direct queue for chunk {chunk_num}")
             
             # ✅ Continue fetching next chunk immediately (independent of consumers)
             offset += current_chunk_size
             chunk_num += 1
-            rows_processed += len(df_pandas)
+            rows_processed += len(df_transformed)
             
-            # Update monitor - progress
+            # Update monitor - progress (pushed by _flush_monitor)
             if MONITOR_AVAILABLE:
-                state = get_state()
-                if 'workers' in state and table in state['workers']:
-                    state['workers'][table][f'producer-{worker_id}']['rows_processed'] = rows_processed
-                    update_state('workers', state['workers'])
+                _worker_rows[(table, f'producer-{worker_id}', 'rows_processed')] = rows_processed
+        
+        if prefetch is not None:
+            prefetch.cancel()
         
         logger.info(f"✓ Producer-{worker_id} completed")
         
@@ -1763,6 +2016,114 @@ async def producer_worker_with_offset(table: str, queue: asyncio.Queue, chunk_si
         raise
 
 
+async def producer_worker_keyset(table: str, queue: asyncio.Queue, chunk_size: int, pk_columns: List[str], cursor_queue: asyncio.Queue, total_rows: int, worker_id: int):
+    """
+    Producer worker using keyset (PK-range) pagination
+
+    Workers share a cursor queue holding (chunk_num, last_pk). A worker
+    takes the cursor, fetches the next chunk by seeking from last_pk, and
+    immediately hands the advanced cursor to the next free worker - so one
+    worker can already be extracting chunk N+1 while this one transforms
+    and caches chunk N. A None token means the table is exhausted.
+    """
+    try:
+        rows_processed = 0
+
+        # Update monitor - initialize worker
+        if MONITOR_AVAILABLE:
+            state = get_state()
+            if 'workers' not in state:
+                state['workers'] = {}
+            if table not in state['workers']:
+                state['workers'][table] = {}
+            state['workers'][table][f'producer-{worker_id}'] = {
+                'type': 'producer',
+                'rows_processed': 0,
+                'total_rows': total_rows,
+                'status': 'running'
+            }
+            update_state('workers', state['workers'])
+
+        while True:
+            token = await cursor_queue.get()
+            if token is None:
+                # Table exhausted - pass the signal on to the other workers
+                cursor_queue.put_nowait(None)
+                break
+
+            chunk_num, last_pk = token
+            cursor_advanced = False
+
+            try:
+                # Extract chunk (seek via clustered index)
+                df_chunk = await extract_chunk_keyset(table, pk_columns, last_pk, chunk_size)
+
+                if len(df_chunk) == 0:
+                    cursor_queue.put_nowait(None)
+                    break
+
+                # Advance the cursor before transforming, so the next worker
+                # can start extracting right away
+                if len(df_chunk) < chunk_size:
+                    cursor_queue.put_nowait(None)
+                else:
+                    next_pk = tuple(df_chunk.iloc[-1][col] for col in pk_columns)
+                    cursor_queue.put_nowait((chunk_num + 1, next_pk))
+                cursor_advanced = True
+
+                # ✅ Transform chunk with Polars (5-10x faster)
+                df_transformed = await transform_data_polars(pl.from_pandas(df_chunk), table, pk_columns)
+
+                # Arrow end-to-end: the Polars frame goes straight to cache/load
+
+                # Free memory from original chunks
+                del df_chunk
+
+                # ✅ Put into cache storage (async/await - non-blocking)
+                success = await cache_storage.put(table, chunk_num, df_transformed, worker_id)
+                if success:
+                    logger.info("🟢 Producer-%s: Chunk %s cached (%d rows) → consumers competing...", worker_id, chunk_num, len(df_transformed))
+                else:
+                    # Fallback to direct queue if cache is full
+                    await queue.put((chunk_num, df_transformed))
+                    logger.warning(f"⚠️  Producer-{worker_id}: Cache full, using direct queue for chunk {chunk_num}")
+            except BaseException:
+                # Give the taken token back before bailing out, otherwise
+                # every sibling producer parks forever on cursor_queue.get()
+                # and leaks across each retry attempt
+                if not cursor_advanced:
+                    cursor_queue.put_nowait(token)
+                raise
+
+            rows_processed += len(df_transformed)
+
+            # Update monitor - progress (pushed by _flush_monitor)
+            if MONITOR_AVAILABLE:
+                _worker_rows[(table, f'producer-{worker_id}', 'rows_processed')] = rows_processed
+
+        logger.info(f"✓ Producer-{worker_id} completed")
+
+        # Update monitor - completed
+        if MONITOR_AVAILABLE:
+            state = get_state()
+            if 'workers' in state and table in state['workers']:
+                state['workers'][table][f'producer-{worker_id}']['status'] = 'completed'
+                update_state('workers', state['workers'])
+
+    except Exception as e:
+        logger.error(f"✗ Producer-{worker_id} error: {e}")
+
+        # Update monitor - failed
+        if MONITOR_AVAILABLE:
+            state = get_state()
+            if 'workers' in state and table in state['workers']:
+                state['workers'][table][f'producer-{worker_id}']['status'] = 'failed'
+                state['workers'][table][f'producer-{worker_id}']['error'] = str(e)[:50]
+                update_state('workers', state['workers'])
+
+        raise
+
+
 # -----------------------------------------
 # 🔹 MAIN ETL RUNNER (Single Table - ASYNC)
 # -----------------------------------------
@@ -1785,50 +2146,108 @@ async def run_etl_for_table(table: str, schema: str):
         
         # Update monitor
         if MONITOR_AVAILABLE:
-            state = get_state()
-            if 'tables_status' not in state:
-                state['tables_status'] = {}
-            state['tables_status'][table] = {
-                'status': 'processing',
-                'progress': 0,
-                'error': None
-            }
-            update_state('tables_status', state['tables_status'])
+            mutate_table_status(table, status='processing', progress=0, error=None)
         
         # Get primary key columns (async)
         loop = asyncio.get_event_loop()
-        src_params = await loop.run_in_executor(None, get_connection_params, "SRC")
+        src_params = get_connection_params("SRC")
         pk_columns = await loop.run_in_executor(None, get_primary_key_columns, src_params, schema, table)
         logger.info(f"Primary key: {pk_columns if pk_columns else 'None'}")
         
-        # Step 1: Extract (async)
-        df = await extract_data(table)
+        # Create table up front so the loader can start immediately
+        await create_table_if_not_exists(table)
         
-        if len(df) == 0:
-            logger.warning(f"⚠️  Table {table} is empty, skipping...")
-            return True
+        chunk_size = get_env_int("CHUNK_SIZE", 50000)
+        batch_size = get_env_int("BATCH_SIZE", 10000)
         
-        # Update progress
-        if MONITOR_AVAILABLE:
-            state = get_state()
-            state['tables_status'][table]['progress'] = 33
-            update_state('tables_status', state['tables_status'])
+        # Three-stage pipeline over bounded queues: extract keeps the
+        # network busy, transform keeps the CPU busy, load keeps the
+        # destination busy - instead of each stage idling while the
+        # previous one finishes the whole table
+        extract_q = asyncio.Queue(maxsize=4)
+        load_q = asyncio.Queue(maxsize=4)
+        rows_extracted = 0
+        rows_loaded = 0
         
-        # Step 2: Transform (async)
-        df_transformed = await transform_data(df, table)
+        async def _producer():
+            nonlocal rows_extracted
+            last_pk = None
+            offset = 0
+            try:
+                while True:
+                    if pk_columns:
+                        df_chunk = await extract_chunk_keyset(table, pk_columns, last_pk, chunk_size)
+                    else:
+                        df_chunk = await extract_chunk_with_offset(table, offset, chunk_size)
+                        offset += chunk_size
+                    
+                    if len(df_chunk) == 0:
+                        break
+                    
+                    rows_extracted += len(df_chunk)
+                    if pk_columns:
+                        last_pk = tuple(df_chunk.iloc[-1][col] for col in pk_columns)
+                    
+                    await extract_q.put(df_chunk)
+                    
+                    if len(df_chunk) < chunk_size:
+                        break
+            except BaseException:
+                # Best-effort wake on the error path only - if the queue is
+                # full here, the sibling cancellation below tears it down
+                try:
+                    extract_q.put_nowait(None)
+                except asyncio.QueueFull:
+                    pass
+                raise
+            else:
+                # EOF sentinel must not be dropped on a full queue (the
+                # steady state when transform is the bottleneck), so the
+                # happy path blocks until there is room
+                await extract_q.put(None)
         
-        # Update progress
-        if MONITOR_AVAILABLE:
-            state = get_state()
-            state['tables_status'][table]['progress'] = 66
-            update_state('tables_status', state['tables_status'])
+        async def _worker():
+            try:
+                while True:
+                    df_chunk = await extract_q.get()
+                    if df_chunk is None:
+                        break
+                    
+                    df_transformed = await transform_data_polars(pl.from_pandas(df_chunk), table, pk_columns)
+                    await load_q.put(df_transformed)
+            except BaseException:
+                try:
+                    load_q.put_nowait(None)
+                except asyncio.QueueFull:
+                    pass
+                raise
+            else:
+                await load_q.put(None)
         
-        # Step 3: Create table (async)
-        await create_table_if_not_exists(table)
+        async def _loader():
+            nonlocal rows_loaded
+            while True:
+                df_transformed = await load_q.get()
+                if df_transformed is None:
+                    break
+                
+                await load_data_infile(df_transformed, table, pk_columns, batch_size)
+                rows_loaded += len(df_transformed)
+        
+        stages = [asyncio.create_task(stage()) for stage in (_producer, _worker, _loader)]
+        try:
+            await asyncio.gather(*stages)
+        except BaseException:
+            # One stage failed: cancel the siblings so they do not stay
+            # parked on their queues (pinning chunks) across retries
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            raise
         
-        # Step 4: Load (async)
-        batch_size = int(get_env("BATCH_SIZE", "10000"))
-        await load_data(df_transformed, table, pk_columns, batch_size)
+        if rows_extracted == 0:
+            logger.warning(f"⚠️  Table {table} is empty, skipping...")
+            return True
         
         # Success
         elapsed = time.time() - start_time
@@ -1838,13 +2257,8 @@ async def run_etl_for_table(table: str, schema: str):
         
         # Update monitor
         if MONITOR_AVAILABLE:
-            state = get_state()
-            state['tables_status'][table]['status'] = 'completed'
-            state['tables_status'][table]['progress'] = 100
-            update_state('tables_status', state['tables_status'])
-            
-            completed = state.get('completed_tables', 0) + 1
-            update_state('completed_tables', completed)
+            mutate_table_status(table, status='completed', progress=100)
+            incr_table_counter('completed_tables')
         
         return True
         
@@ -1853,15 +2267,8 @@ async def run_etl_for_table(table: str, schema: str):
         
         # Update monitor
         if MONITOR_AVAILABLE:
-            state = get_state()
-            if table in state.get('tables_status', {}):
-                state['tables_status'][table]['status'] = 'failed'
-                state['tables_status'][table]['error'] = str(e)[:100]
-                state['tables_status'][table]['progress'] = 0
-                update_state('tables_status', state['tables_status'])
-            
-            failed = state.get('failed_tables', 0) + 1
-            update_state('failed_tables', failed)
+            mutate_table_status(table, status='failed', error=str(e)[:100], progress=0)
+            incr_table_counter('failed_tables')
         
         return False
 
@@ -1964,50 +2371,63 @@ async def run_etl_all_tables():
     successful = 0
     failed = 0
     
-    # Get number of workers from env
-    max_workers = int(get_env("MAX_WORKERS", "10"))
-    num_producers = max_workers // 2
-    num_consumers = max_workers - num_producers
+    # Get number of workers from env; the worker budget is split across
+    # however many tables run at once so total concurrency stays bounded
+    max_workers = get_env_int("MAX_WORKERS", 10)
+    concurrent_tables = max(get_env_int("CONCURRENT_TABLES", 2), 1)
+    concurrent_tables = min(concurrent_tables, max(len(tables), 1))
+    workers_per_table = max(max_workers // concurrent_tables, 2)
+    num_producers = workers_per_table // 2
+    num_consumers = workers_per_table - num_producers
     
-    logger.info(f"Worker configuration: {num_producers} producers, {num_consumers} consumers")
+    logger.info(f"Worker configuration: {concurrent_tables} tables x ({num_producers} producers, {num_consumers} consumers)")
     
-    for schema, table in tables:
-        # Retry configuration
-        max_retries = 3
-        retry_delay = 5  # seconds
-        attempt = 0
-        success = False
-        
-        # Retry loop until success or max retries
-        while attempt < max_retries and not success:
-            attempt += 1
-            
-            if attempt > 1:
-                logger.warning(f"🔄 Retry attempt {attempt}/{max_retries} for table {table}")
+    # Tables run K at a time - while one table is in its consumer-bound
+    # tail, another table's producers keep the source busy
+    table_sem = asyncio.Semaphore(concurrent_tables)
+    
+    async def _run_one(schema: str, table: str) -> bool:
+        async with table_sem:
+            # Retry loop until success or max retries
+            max_retries = 3
+            retry_delay = 5  # seconds
+            
+            for attempt in range(1, max_retries + 1):
+                if attempt > 1:
+                    logger.warning(f"🔄 Retry attempt {attempt}/{max_retries} for table {table}")
+                    
+                    # Update monitor with retry status
+                    if MONITOR_AVAILABLE:
+                        mutate_table_status(table, status='retrying', error=f'Retry attempt {attempt}/{max_retries}')
+                    
+                    await asyncio.sleep(retry_delay)
                 
-                # Update monitor with retry status
-                if MONITOR_AVAILABLE:
-                    state = get_state()
-                    if table in state.get('tables_status', {}):
-                        state['tables_status'][table]['status'] = 'retrying'
-                        state['tables_status'][table]['error'] = f'Retry attempt {attempt}/{max_retries}'
-                        update_state('tables_status', state['tables_status'])
+                # Use parallel ETL with producer/consumer pattern
+                success = await run_etl_for_table_parallel(table, schema, num_producers, num_consumers)
+                
+                if success:
+                    logger.info(f"✅ Table {table} completed successfully")
+                    return True
                 
-                await asyncio.sleep(retry_delay)
-            
-            # Use parallel ETL with producer/consumer pattern
-            success = await run_etl_for_table_parallel(table, schema, num_producers, num_consumers)
-            
-            if success:
-                successful += 1
-                logger.info(f"✅ Table {table} completed successfully")
-                break
-            else:
                 if attempt < max_retries:
                     logger.warning(f"❌ Table {table} failed, retrying in {retry_delay}s...")
                 else:
                     logger.error(f"❌ Table {table} failed after {max_retries} attempts")
-                    failed += 1
+            
+            return False
+    
+    results = await asyncio.gather(
+        *[_run_one(schema, table) for schema, table in tables],
+        return_exceptions=True,
+    )
+    for (schema, table), result in zip(tables, results):
+        if isinstance(result, Exception):
+            logger.error(f"❌ Table {table} crashed: {result}")
+            failed += 1
+        elif result:
+            successful += 1
+        else:
+            failed += 1
     
     # Summary
     logger.info("="*80)
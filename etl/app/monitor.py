@@ -91,6 +91,44 @@ def get_state():
         return etl_state.copy()
 
 
+def incr_table_counter(key):
+    """Atomically bump completed_tables / failed_tables
+
+    With tables finishing concurrently, a get_state() + update_state()
+    read-modify-write can lose increments; doing += under the state lock
+    cannot.
+    """
+    with state_lock:
+        etl_state[key] = etl_state.get(key, 0) + 1
+
+    try:
+        socketio.emit('state_update', {
+            'key': key,
+            'timestamp': time.time()
+        }, namespace='/')
+    except:
+        pass  # Ignore if no clients connected
+
+
+def mutate_table_status(table, **fields):
+    """Update one table's status in place
+
+    Progress ticks only touch a single table, so mutating that entry
+    under the lock avoids copying and re-assigning the whole
+    tables_status map on every update.
+    """
+    with state_lock:
+        etl_state['tables_status'].setdefault(table, {}).update(fields)
+
+    try:
+        socketio.emit('state_update', {
+            'key': 'tables_status',
+            'timestamp': time.time()
+        }, namespace='/')
+    except:
+        pass  # Ignore if no clients connected
+
+
 def add_log(message, level='INFO'):
     """Add a log message to the state"""
     with state_lock:
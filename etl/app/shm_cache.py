@@ -0,0 +1,156 @@
+"""
+Shared-Memory Cache Backend for ETL Pipeline
+Zero-copy DataFrame handoff between processes via pickle protocol 5
+out-of-band buffers written into multiprocessing.shared_memory blocks
+"""
+
+import pickle
+import struct
+import logging
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Block layout: 8-byte header length, pickle header bytes, then the raw
+# out-of-band buffer frames back to back
+_LEN_FMT = "<Q"
+_LEN_SIZE = struct.calcsize(_LEN_FMT)
+
+
+class SharedMemoryCacheBackend:
+    """
+    Cross-process cache backend backed by shared memory
+
+    put() pickles a DataFrame with protocol 5, capturing the large column
+    buffers out-of-band via buffer_callback, and writes the small pickle
+    header plus the raw buffer frames into one SharedMemory block. Only the
+    block name and frame sizes travel through the handoff queue - the data
+    itself is never serialized through a pipe or copied between processes.
+
+    get() attaches to the block by name and unpickles with buffers=, so the
+    reconstructed column arrays are zero-copy views over shared memory until
+    pandas needs to mutate them. The block is unlinked after consumption.
+    """
+
+    def __init__(self, queue: Optional[multiprocessing.Queue] = None):
+        """
+        Initialize shared-memory backend
+
+        Args:
+            queue: Handoff queue carrying (shm_name, header_len, frame_sizes)
+                   tuples; created here if not supplied
+        """
+        self.queue = queue if queue is not None else multiprocessing.Queue()
+
+        # Statistics
+        self.stats = {
+            'blocks_written': 0,
+            'blocks_read': 0,
+            'bytes_written': 0
+        }
+
+    def put(self, data: pd.DataFrame) -> bool:
+        """
+        Write a DataFrame into a new shared-memory block and enqueue its name
+
+        Args:
+            data: DataFrame to hand off
+
+        Returns:
+            True if stored successfully
+        """
+        try:
+            # Out-of-band pickling: the header stays tiny, the column
+            # buffers are captured as raw frames without copying
+            frames = []
+            header = pickle.dumps(data, protocol=5, buffer_callback=frames.append)
+
+            frame_views = [frame.raw() for frame in frames]
+            frame_sizes = [view.nbytes for view in frame_views]
+            total = _LEN_SIZE + len(header) + sum(frame_sizes)
+
+            shm = shared_memory.SharedMemory(create=True, size=total)
+            try:
+                offset = 0
+                shm.buf[offset:offset + _LEN_SIZE] = struct.pack(_LEN_FMT, len(header))
+                offset += _LEN_SIZE
+                shm.buf[offset:offset + len(header)] = header
+                offset += len(header)
+                for view, size in zip(frame_views, frame_sizes):
+                    shm.buf[offset:offset + size] = view
+                    offset += size
+
+                self.queue.put((shm.name, frame_sizes))
+
+                self.stats['blocks_written'] += 1
+                self.stats['bytes_written'] += total
+
+                logger.debug(f"📦 SHM cached: {shm.name} ({total / 1048576:.2f}MB, {len(frames)} buffers)")
+                return True
+            finally:
+                # Close our mapping; the consumer re-attaches by name and
+                # unlinks the block once it is done
+                shm.close()
+
+        except Exception as e:
+            logger.error(f"❌ SHM put error: {e}")
+            return False
+
+    def get(self, timeout: float = 5.0) -> Optional[pd.DataFrame]:
+        """
+        Attach to the next shared-memory block and rebuild the DataFrame
+
+        Args:
+            timeout: Timeout in seconds
+
+        Returns:
+            DataFrame or None if timeout
+        """
+        try:
+            shm_name, frame_sizes = self.queue.get(timeout=timeout)
+        except Exception:
+            return None
+
+        try:
+            shm = shared_memory.SharedMemory(name=shm_name)
+        except FileNotFoundError:
+            logger.warning(f"⚠️  SHM block missing: {shm_name}")
+            return None
+
+        try:
+            offset = 0
+            (header_len,) = struct.unpack_from(_LEN_FMT, shm.buf, offset)
+            offset += _LEN_SIZE
+            header = bytes(shm.buf[offset:offset + header_len])
+            offset += header_len
+
+            # buffers= hands pickle zero-copy views over the shared block
+            buffers = []
+            for size in frame_sizes:
+                buffers.append(pickle.PickleBuffer(shm.buf[offset:offset + size]))
+                offset += size
+
+            df = pickle.loads(header, buffers=buffers)
+
+            # Unlink now - the OS keeps the memory alive while mappings
+            # exist - and pin our mapping to the DataFrame so the zero-copy
+            # views stay valid for its lifetime
+            shm.unlink()
+            df.attrs['_shm'] = shm
+            self.stats['blocks_read'] += 1
+
+            logger.debug(f"📤 SHM retrieved: {shm_name}")
+            return df
+
+        except Exception as e:
+            logger.error(f"❌ SHM get error: {e}")
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+            return None